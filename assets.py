@@ -0,0 +1,29 @@
+"""Page stylesheets, minified once per process and emitted as a single style block per page"""
+import os
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name):
+    """Minified contents of assets/<name>.css"""
+    with open(os.path.join(ASSET_DIR, f'{name}.css')) as f:
+        return minify_css(f.read())
+
+
+def inject_styles(*names):
+    """Emit the named stylesheets as one <style> element"""
+    st.markdown(f"<style>{''.join(stylesheet(name) for name in names)}</style>", unsafe_allow_html=True)
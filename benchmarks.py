@@ -0,0 +1,313 @@
+"""Benchmarks for data generation, marketplace filtering, analytics, model training and invoice rendering.
+
+Runs without a Streamlit server and compares the results against a baseline
+recorded earlier on the same machine, so regressions show up before deployment.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from catalogue import PropertyCatalogue
+from features import build_feature_matrix
+from forecasting import fit_prophet_forecast
+from historical_data import LOCATIONS, generate_historical_panel
+from invoices import create_pdf_invoice
+from resources import generate_dummy_properties, HISTORICAL_DATA_SEED, PROPERTY_CATALOGUE_SEED
+from training import fit_linear_regression, fit_xgboost
+from views.analytics_page import filter_history, location_performance, mean_roi_series, property_comparison, top_properties_by_roi
+
+# Baselines are only comparable on the machine that recorded them, so each
+# environment keeps its own file here
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.benchmarks')
+
+# Scale factors multiply the app's 20 demo properties
+DEFAULT_SCALES = [1, 10, 50]
+GROUPS = ['data', 'marketplace', 'analytics', 'training', 'invoices']
+
+DEFAULT_REPEATS = 15
+
+# Benchmarks are compared on their fastest run. The allowed slowdown comes from
+# the measured noise: NOISE_MULTIPLIER times the larger within-run spread of the
+# two reports, or RUN_NOISE_MULTIPLIER times how far the baseline's own runs
+# disagreed, whichever is larger, and at least MIN_TOLERANCE.
+NOISE_MULTIPLIER = 3
+RUN_NOISE_MULTIPLIER = 2
+MIN_TOLERANCE = 0.15
+# A flagged benchmark is re-measured in fresh interpreters and only reported if it regresses every time
+CONFIRM_RUNS = 2
+
+
+def scaled_properties(scale):
+    """scale copies of the demo catalogue with distinct seeds and unique ids"""
+    properties = [record for seed in range(scale) for record in generate_dummy_properties(seed=seed)]
+    return [dict(record, id=f'PROP_{i+1:03d}') for i, record in enumerate(properties)]
+
+
+def scaled_history(scale):
+    return generate_historical_panel(n_properties=20 * scale, seed=HISTORICAL_DATA_SEED)
+
+
+def data_cases(scales):
+    for scale in scales:
+        yield f'data.properties[x{scale}]', lambda scale=scale: scaled_properties(scale), 20 * scale
+        yield f'data.historical[x{scale}]', lambda scale=scale: scaled_history(scale), 20 * scale
+
+
+def marketplace_cases(scales):
+    def filter_chain(catalogue):
+        # The marketplace page's path from filter widgets to the records of one page of cards
+        positions = catalogue.positions(location='Karachi', min_roi=15, max_price=40000000, property_type='Residential')
+        page = PropertyCatalogue.page(catalogue.frame.iloc[positions], sort_by='roi', descending=True, page=1, page_size=10)
+        return PropertyCatalogue.records(page)
+
+    for scale in scales:
+        properties = scaled_properties(scale)
+        catalogue = PropertyCatalogue.from_records(properties)
+        yield f'marketplace.catalogue[x{scale}]', lambda properties=properties: PropertyCatalogue.from_records(properties), len(properties)
+        yield f'marketplace.filter_chain[x{scale}]', lambda catalogue=catalogue: filter_chain(catalogue), len(properties)
+
+
+def analytics_cases(scales):
+    for scale in scales:
+        history = scaled_history(scale)
+        date_range = (history['date'].min(), history['date'].max())
+        filtered = filter_history(history, LOCATIONS, date_range, 8)
+        rows = len(history)
+        yield f'analytics.filter[x{scale}]', lambda history=history, date_range=date_range: filter_history(history, LOCATIONS, date_range, 8), rows
+        yield f'analytics.top_properties[x{scale}]', lambda filtered=filtered: top_properties_by_roi(filtered), rows
+        yield f'analytics.mean_roi_series[x{scale}]', lambda filtered=filtered: mean_roi_series(filtered), rows
+        yield f'analytics.property_comparison[x{scale}]', lambda filtered=filtered: property_comparison(filtered), rows
+        yield f'analytics.location_performance[x{scale}]', lambda filtered=filtered: location_performance(filtered), rows
+
+
+def training_cases(scales):
+    # Fits run on what the analytics page trains on with its default filters
+    history = scaled_history(1)
+    filtered = filter_history(history, LOCATIONS, (history['date'].min(), history['date'].max()), 8)
+    X, y, _ = build_feature_matrix(history, generate_dummy_properties(seed=PROPERTY_CATALOGUE_SEED)).select(filtered.index)
+    series = mean_roi_series(filtered)
+    yield 'training.prophet', lambda: fit_prophet_forecast(series, periods=12, freq='M'), len(series)
+    yield 'training.xgboost', lambda: fit_xgboost(X, y), len(y)
+    yield 'training.linear_regression', lambda: fit_linear_regression(X, y), len(y)
+
+
+def invoice_cases(scales, invoices=20):
+    def render():
+        for i in range(invoices):
+            create_pdf_invoice('Benchmark Tower', 1000000 + i, 500.0, 1.25, 18.5, invoice_number=f'BENCH-{i:04d}')
+
+    yield f'invoices.create_pdf[{invoices}]', render, invoices
+
+
+def calibration():
+    """Fixed interpreter and NumPy workload that does not depend on app code; it tracks the machine's current speed"""
+    sum(i * i for i in range(100000))
+    np.sort(np.random.default_rng(0).random(200000))
+
+
+CASES = {
+    'data': data_cases,
+    'marketplace': marketplace_cases,
+    'analytics': analytics_cases,
+    'training': training_cases,
+    'invoices': invoice_cases
+}
+
+
+def environment_key():
+    """Baseline name for this machine; PROPTOKEN_BENCHMARK_ENV overrides it, e.g. for a CI runner class"""
+    key = os.environ.get('PROPTOKEN_BENCHMARK_ENV') or (
+        f"{platform.node()}-{platform.machine()}-{os.cpu_count()}cpu-py{platform.python_version()}"
+    )
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', key)
+
+
+def baseline_path(environment=None):
+    return os.path.join(BASELINE_DIR, f'{environment or environment_key()}.json')
+
+
+def summarize(timings):
+    """Fastest and median run, plus the spread: how far the lower quartile sits above the fastest run"""
+    timings = sorted(timings)
+    fastest = timings[0]
+    lower_quartile = timings[int(0.25 * (len(timings) - 1))]
+    return {
+        'min_seconds': fastest,
+        'median_seconds': statistics.median(timings),
+        'spread': (lower_quartile - fastest) / fastest if fastest else 0.0
+    }
+
+
+def measure(cases, repeats=DEFAULT_REPEATS, warmup=1):
+    """name -> wall time of each of repeats calls, after warmup untimed calls.
+
+    Cases are timed round-robin, one call each per round, so a slow spell on
+    the machine is spread across every case instead of landing on one.
+    """
+    for _ in range(warmup):
+        for _, fn, _ in cases:
+            fn()
+    timings = {name: [] for name, _, _ in cases}
+    for _ in range(repeats):
+        for name, fn, _ in cases:
+            started = time.perf_counter()
+            fn()
+            timings[name].append(time.perf_counter() - started)
+    return timings
+
+
+def run(groups=GROUPS, scales=DEFAULT_SCALES, repeats=DEFAULT_REPEATS):
+    """Run the benchmark groups and return the report dict"""
+    cases = [('calibration', calibration, 1)] + [case for group in groups for case in CASES[group](scales)]
+    timings = measure(cases, repeats=repeats)
+    results = []
+    for name, _, items in cases:
+        stats = summarize(timings[name])
+        results.append({
+            'name': name,
+            'repeats': repeats,
+            **stats,
+            'timings': timings[name],
+            'items': items,
+            'items_per_second': items / stats['min_seconds'] if stats['min_seconds'] else None
+        })
+        print(f"{name}: {stats['min_seconds']:.4f}s (spread {stats['spread']:.0%})", file=sys.stderr)
+    return {
+        'created_at': datetime.now().isoformat(),
+        'environment': environment_key(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'scales': scales,
+        'results': results
+    }
+
+
+def combine(reports):
+    """Baseline from several runs: per benchmark, the median fastest time (scaled to the median
+    calibration speed), the median spread, and how far the runs' fastest times disagreed"""
+    calibration = [{entry['name']: entry for entry in report['results']}['calibration']['min_seconds'] for report in reports]
+    reference = statistics.median(calibration)
+    results = []
+    for position, entry in enumerate(reports[0]['results']):
+        entries = [report['results'][position] for report in reports]
+        fastest = [e['min_seconds'] * reference / speed for e, speed in zip(entries, calibration)]
+        middle = statistics.median(fastest)
+        results.append(dict(
+            entry,
+            min_seconds=middle,
+            median_seconds=statistics.median(e['median_seconds'] for e in entries),
+            spread=statistics.median(e['spread'] for e in entries),
+            run_spread=(max(fastest) - min(fastest)) / middle if middle else 0.0,
+            timings=[t for e in entries for t in e['timings']]
+        ))
+    return dict(reports[-1], runs=len(reports), results=results)
+
+
+def run_in_subprocess(groups, scales, repeats):
+    """run() in a fresh interpreter, the same conditions a later comparison run starts from"""
+    with tempfile.TemporaryDirectory() as root:
+        output = os.path.join(root, 'report.json')
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--skip-compare', '--output', output,
+             '--only', *groups, '--scales', *map(str, scales), '--repeats', str(repeats)],
+            check=True, stdout=subprocess.DEVNULL
+        )
+        with open(output) as f:
+            return json.load(f)
+
+
+def compare(report, baseline, noise_multiplier=NOISE_MULTIPLIER, run_noise_multiplier=RUN_NOISE_MULTIPLIER, min_tolerance=MIN_TOLERANCE):
+    """Benchmarks present in both reports, with their slowdown, allowed slowdown and whether it counts as a regression"""
+    previous = {entry['name']: entry for entry in baseline['results']}
+    current = {entry['name']: entry for entry in report['results']}
+    # Times are scaled by how fast the machine ran the calibration workload in each run
+    speed = current['calibration']['min_seconds'] / previous['calibration']['min_seconds']
+    comparison = []
+    for entry in report['results']:
+        if entry['name'] == 'calibration' or entry['name'] not in previous:
+            continue
+        baseline_entry = previous[entry['name']]
+        baseline_seconds = baseline_entry['min_seconds']
+        ratio = entry['min_seconds'] / speed / baseline_seconds if baseline_seconds else None
+        tolerance = max(
+            min_tolerance,
+            noise_multiplier * max(entry['spread'], baseline_entry['spread']),
+            run_noise_multiplier * baseline_entry.get('run_spread', 0.0)
+        )
+        comparison.append({
+            'name': entry['name'],
+            'baseline_seconds': baseline_seconds,
+            'min_seconds': entry['min_seconds'],
+            'ratio': ratio,
+            'tolerance': tolerance,
+            'regressed': ratio is not None and ratio > 1 + tolerance
+        })
+    return comparison
+
+
+def confirm(regressions, baseline, scales, repeats, runs=CONFIRM_RUNS, **tolerances):
+    """The regressions that still regress when their groups are re-run in fresh interpreters"""
+    for _ in range(runs):
+        if not regressions:
+            break
+        groups = sorted({name.split('.')[0] for name in regressions})
+        comparison = compare(run_in_subprocess(groups, scales, repeats), baseline, **tolerances)
+        regressions = [entry['name'] for entry in comparison if entry['regressed'] and entry['name'] in regressions]
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PropToken hot paths and compare them with a stored baseline")
+    parser.add_argument('--only', nargs='+', choices=GROUPS, default=GROUPS, help="Benchmark groups to run")
+    parser.add_argument('--scales', nargs='+', type=int, default=DEFAULT_SCALES, help="Multiples of the 20 demo properties")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--baseline', help="Baseline report to compare against (default: this machine's file in .benchmarks/)")
+    parser.add_argument('--noise-multiplier', type=float, default=NOISE_MULTIPLIER, help="Allowed slowdown in multiples of the measured spread")
+    parser.add_argument('--min-tolerance', type=float, default=MIN_TOLERANCE, help="Smallest allowed slowdown, e.g. 0.15 for 15%%")
+    parser.add_argument('--confirm-runs', type=int, default=CONFIRM_RUNS, help="Re-runs a regression must survive before it is reported")
+    parser.add_argument('--save-baseline', action='store_true', help="Record a baseline for this machine instead of comparing")
+    parser.add_argument('--baseline-runs', type=int, default=5, help="Runs, each in a fresh interpreter, combined into a recorded baseline")
+    parser.add_argument('--skip-compare', action='store_true', help="Only measure; do not compare against a baseline")
+    parser.add_argument('--output', help="Also write the report to this JSON file")
+    args = parser.parse_args()
+
+    path = args.baseline or baseline_path()
+    if args.save_baseline:
+        report = combine([run_in_subprocess(args.only, args.scales, args.repeats) for _ in range(args.baseline_runs)])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        report = run(groups=args.only, scales=args.scales, repeats=args.repeats)
+    if args.save_baseline or args.skip_compare:
+        pass
+    elif os.path.exists(path):
+        with open(path) as f:
+            baseline = json.load(f)
+        tolerances = {'noise_multiplier': args.noise_multiplier, 'min_tolerance': args.min_tolerance}
+        report['comparison'] = compare(report, baseline, **tolerances)
+        flagged = [entry['name'] for entry in report['comparison'] if entry['regressed']]
+        report['regressions'] = confirm(flagged, baseline, args.scales, args.repeats, runs=args.confirm_runs, **tolerances)
+    else:
+        print(f"No baseline at {path}; record one on this machine with --save-baseline", file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    if report.get('regressions'):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
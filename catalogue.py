@@ -0,0 +1,224 @@
+"""Columnar marketplace property catalogue"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from features import PROPERTY_TYPES
+from historical_data import LOCATIONS
+
+CATALOGUE_COLUMNS = [
+    'id', 'name', 'location', 'price', 'roi', 'tokens_supply', 'tokens_available',
+    'image_url', 'description', 'property_type', 'year_built', 'square_feet'
+]
+
+
+class PropertyCatalogue:
+    """Marketplace listings stored as one DataFrame with categorical location and type columns"""
+
+    def __init__(self, frame=None):
+        if frame is None:
+            frame = pd.DataFrame(columns=CATALOGUE_COLUMNS)
+        frame = frame[CATALOGUE_COLUMNS].reset_index(drop=True)
+        frame['location'] = pd.Categorical(frame['location'], categories=_categories(LOCATIONS, frame['location']))
+        frame['property_type'] = pd.Categorical(frame['property_type'], categories=_categories(PROPERTY_TYPES, frame['property_type']))
+        self.frame = frame
+        self.index = CatalogueIndex(frame)
+
+    @classmethod
+    def from_records(cls, properties):
+        return cls(pd.DataFrame(list(properties), columns=CATALOGUE_COLUMNS))
+
+    def __len__(self):
+        return len(self.frame)
+
+    def locations(self):
+        """Locations that have at least one listing, in catalogue order"""
+        present = np.bincount(self.frame['location'].cat.codes.to_numpy() + 1, minlength=len(self.frame['location'].cat.categories) + 1)[1:]
+        return [location for location, count in zip(self.frame['location'].cat.categories, present) if count]
+
+    def positions(self, location=None, min_roi=None, max_price=None, property_type=None):
+        """Row positions of the listings matching every given criterion"""
+        return self.index.query(location=location, property_type=property_type, min_roi=min_roi, max_price=max_price)
+
+    def copy(self):
+        """An independent catalogue sharing column data with this one until either is appended to"""
+        catalogue = object.__new__(PropertyCatalogue)
+        catalogue.frame = self.frame.copy(deep=False)
+        catalogue.index = self.index.copy()
+        return catalogue
+
+    def append(self, record):
+        """Add one listing"""
+        row = pd.DataFrame([record], columns=CATALOGUE_COLUMNS)
+        frame = self.frame
+        for column in ('location', 'property_type'):
+            categories = frame[column].cat.categories
+            new = [value for value in row[column].unique() if value not in categories]
+            if new:
+                frame[column] = frame[column].cat.add_categories(new)
+            row[column] = pd.Categorical(row[column], categories=frame[column].cat.categories)
+        self.frame = pd.concat([frame, row], ignore_index=True) if len(frame) else row
+        self.index.add(len(self.frame) - 1, record)
+
+    @staticmethod
+    def page(frame, sort_by=None, descending=False, page=1, page_size=10):
+        """One page of a (filtered) slice, optionally sorted by a numeric column.
+
+        Rows with equal sort values keep their catalogue order, so paging
+        through a sort visits every row exactly once. Only the rows up to the
+        end of the requested page are fully sorted; the rest are just
+        partitioned off.
+        """
+        total = len(frame)
+        start = (page - 1) * page_size
+        stop = min(start + page_size, total)
+        if start >= total:
+            return frame.iloc[0:0]
+        if sort_by is None:
+            return frame.iloc[start:stop]
+        values = frame[sort_by].to_numpy(dtype=np.float64)
+        if descending:
+            values = -values
+        boundary = np.partition(values, stop - 1)[stop - 1] if stop < total else np.nan
+        if np.isnan(boundary):
+            candidates = np.arange(total)
+        else:
+            # Every row tied with the page's last value is a candidate, so which
+            # of them lands on this page does not depend on the partition order
+            candidates = np.flatnonzero(values <= boundary)
+        order = candidates[np.lexsort((candidates, values[candidates]))]
+        return frame.iloc[order[start:stop]]
+
+    @staticmethod
+    def records(frame):
+        """Plain dicts for rendering a (filtered) slice of the catalogue"""
+        return frame.to_dict('records')
+
+
+class SharedCatalogue:
+    """One process-wide catalogue published as immutable, versioned snapshots.
+
+    Readers take snapshot() and must not modify it. Writers copy the current
+    snapshot, append to the copy and publish it under the next version, so
+    sessions can cache anything derived from a snapshot until the version
+    moves on.
+    """
+
+    def __init__(self, catalogue):
+        self._snapshot = (1, catalogue)
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return self._snapshot[0]
+
+    def snapshot(self):
+        """(version, catalogue) for the current listings"""
+        return self._snapshot
+
+    def append(self, record):
+        """Publish a new snapshot with one more listing; returns its version"""
+        with self._lock:
+            version, catalogue = self._snapshot
+            catalogue = catalogue.copy()
+            catalogue.append(record)
+            self._snapshot = (version + 1, catalogue)
+            return version + 1
+
+
+def _categories(known, values):
+    extra = sorted(set(values.dropna()) - set(known))
+    return list(known) + extra
+
+
+class CatalogueIndex:
+    """Secondary indexes over catalogue row positions.
+
+    location and property_type have hash indexes (value -> row positions);
+    price and roi are kept as sorted arrays so range predicates resolve with a
+    binary search. A query starts from the most selective predicate and checks
+    the others only against that candidate set, so its cost follows the
+    result size rather than the catalogue size.
+    """
+
+    HASH_COLUMNS = ('location', 'property_type')
+    RANGE_COLUMNS = ('price', 'roi')
+
+    def __init__(self, frame):
+        self.size = len(frame)
+        self._hash = {}
+        self._codes = {}
+        self._values = {}
+        self._sorted = {}
+        for column in self.HASH_COLUMNS:
+            values = frame[column].astype(object).to_numpy()
+            codes = {value: code for code, value in enumerate(dict.fromkeys(values))}
+            self._codes[column] = codes
+            self._values[column] = np.array([codes[value] for value in values], dtype=np.int32)
+            order = np.argsort(self._values[column], kind='stable')
+            bounds = np.searchsorted(self._values[column][order], np.arange(len(codes) + 1))
+            self._hash[column] = {value: order[bounds[code]:bounds[code + 1]] for value, code in codes.items()}
+        for column in self.RANGE_COLUMNS:
+            values = frame[column].to_numpy(dtype=np.float64)
+            order = np.argsort(values, kind='stable')
+            self._values[column] = values
+            self._sorted[column] = (values[order], order)
+
+    def copy(self):
+        """A copy that add() can extend without touching this index; arrays are replaced, never mutated"""
+        index = object.__new__(CatalogueIndex)
+        index.size = self.size
+        index._hash = {column: dict(values) for column, values in self._hash.items()}
+        index._codes = {column: dict(codes) for column, codes in self._codes.items()}
+        index._values = dict(self._values)
+        index._sorted = dict(self._sorted)
+        return index
+
+    def add(self, position, record):
+        """Index one appended row without rebuilding"""
+        for column in self.HASH_COLUMNS:
+            value = record[column]
+            codes = self._codes[column]
+            if value not in codes:
+                codes[value] = len(codes)
+            self._values[column] = np.append(self._values[column], np.int32(codes[value]))
+            self._hash[column][value] = np.append(self._hash[column].get(value, np.empty(0, dtype=np.int64)), position)
+        for column in self.RANGE_COLUMNS:
+            value = float(record[column])
+            sorted_values, order = self._sorted[column]
+            at = np.searchsorted(sorted_values, value, side='right')
+            self._sorted[column] = (np.insert(sorted_values, at, value), np.insert(order, at, position))
+            self._values[column] = np.append(self._values[column], value)
+        self.size = position + 1
+
+    def _range(self, column, low=None, high=None):
+        sorted_values, order = self._sorted[column]
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+        stop = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side='right')
+        return order[start:stop]
+
+    def query(self, location=None, property_type=None, min_roi=None, max_price=None):
+        """Sorted row positions matching every given criterion"""
+        candidates = []
+        checks = []
+        for column, value in (('location', location), ('property_type', property_type)):
+            if value is not None:
+                candidates.append(self._hash[column].get(value, np.empty(0, dtype=np.int64)))
+                code = self._codes[column].get(value, -1)
+                checks.append(lambda positions, column=column, code=code: self._values[column][positions] == code)
+        if min_roi is not None:
+            candidates.append(self._range('roi', low=min_roi))
+            checks.append(lambda positions: self._values['roi'][positions] >= min_roi)
+        if max_price is not None:
+            candidates.append(self._range('price', high=max_price))
+            checks.append(lambda positions: self._values['price'][positions] <= max_price)
+
+        if not candidates:
+            return np.arange(self.size)
+        driver = min(range(len(candidates)), key=lambda i: len(candidates[i]))
+        positions = candidates[driver]
+        for i, check in enumerate(checks):
+            if i != driver and len(positions):
+                positions = positions[check(positions)]
+        return np.sort(positions)
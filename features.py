@@ -0,0 +1,103 @@
+"""Leakage-free feature pipeline shared by the XGBoost and regression models"""
+import hashlib
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from historical_data import LOCATIONS
+
+PROPERTY_TYPES = ['Residential', 'Commercial', 'Mixed-Use']
+
+# ROI lags and rolling windows only look at months strictly before the target month
+ROI_LAGS = [1, 3, 12]
+ROI_WINDOWS = [3, 12]
+
+FEATURE_COLUMNS = (
+    ['price', 'year_built', 'square_feet', 'tokens_supply', 'month_sin', 'month_cos']
+    + [f'roi_lag_{lag}' for lag in ROI_LAGS]
+    + [f'roi_rolling_{stat}_{window}' for window in ROI_WINDOWS for stat in ('mean', 'std')]
+    + [f'location_{location}' for location in LOCATIONS]
+    + [f'type_{property_type}' for property_type in PROPERTY_TYPES]
+)
+
+
+class FeatureMatrix:
+    """Precomputed float32 feature matrix aligned with rows of the history frame"""
+
+    def __init__(self, index, X, y):
+        self.index = index
+        self.X = X
+        self.y = y
+        self.columns = FEATURE_COLUMNS
+
+    @cached_property
+    def fingerprint(self):
+        """SHA-256 of the matrix and target, so models trained on other data are never reused"""
+        digest = hashlib.sha256()
+        for array in (self.X, self.y):
+            digest.update(f'{array.shape}{array.dtype}'.encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def positions(self, index):
+        """Row positions of the history rows in index that have a full feature row"""
+        positions = self.index.get_indexer(index)
+        return positions[positions >= 0]
+
+    def select(self, index):
+        """Return (X, y, index) for the history rows in index that have a full feature row"""
+        positions = self.positions(index)
+        return self.X[positions], self.y[positions], self.index[positions]
+
+
+def _lagged_roi_features(history):
+    """Lag and rolling ROI features computed per property without crossing property boundaries"""
+    roi = history['roi']
+    position = history.groupby('property_id', observed=True, sort=False).cumcount().to_numpy()
+    features = {}
+    # The history is sorted by property then date, so shifting the whole column and
+    # masking each property's first rows is equivalent to a per-property shift
+    for lag in ROI_LAGS:
+        features[f'roi_lag_{lag}'] = roi.shift(lag).where(position >= lag)
+    previous = roi.shift(1)
+    for window in ROI_WINDOWS:
+        rolling = previous.rolling(window)
+        valid = position >= window
+        features[f'roi_rolling_mean_{window}'] = rolling.mean().where(valid)
+        features[f'roi_rolling_std_{window}'] = rolling.std().where(valid)
+    return pd.DataFrame(features, index=history.index)
+
+
+def build_feature_matrix(history, properties):
+    """Join property attributes onto the history and add lagged ROI features.
+
+    The target is the month's ROI; it never appears among the features. Rows
+    without a full lag window (each property's first months) are dropped.
+    """
+    history = history.sort_values(['property_id', 'date'], kind='stable')
+
+    attributes = pd.DataFrame(properties)[['id', 'location', 'property_type', 'year_built', 'square_feet', 'tokens_supply']]
+    attributes = attributes.rename(columns={'id': 'property_id', 'location': 'property_location'}).set_index('property_id')
+    joined = attributes.reindex(history['property_id'].astype(str).to_numpy())
+    joined.index = history.index
+
+    month = history['date'].dt.month.to_numpy()
+    frame = pd.concat([
+        history[['price']],
+        joined[['year_built', 'square_feet', 'tokens_supply']],
+        pd.DataFrame({
+            'month_sin': np.sin(2 * np.pi * month / 12),
+            'month_cos': np.cos(2 * np.pi * month / 12)
+        }, index=history.index),
+        _lagged_roi_features(history)
+    ], axis=1)
+    for location in LOCATIONS:
+        frame[f'location_{location}'] = (joined['property_location'] == location).to_numpy()
+    for property_type in PROPERTY_TYPES:
+        frame[f'type_{property_type}'] = (joined['property_type'] == property_type).to_numpy()
+
+    complete = frame[FEATURE_COLUMNS].notna().all(axis=1).to_numpy()
+    X = np.ascontiguousarray(frame[FEATURE_COLUMNS].to_numpy(dtype=np.float32)[complete])
+    y = np.ascontiguousarray(history['roi'].to_numpy(dtype=np.float32)[complete])
+    return FeatureMatrix(history.index[complete], X, y)
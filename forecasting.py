@@ -0,0 +1,212 @@
+"""Prophet forecasting with a shared, memory-bounded forecast cache"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError
+
+import pandas as pd
+
+from startup import LazyModule
+
+# Prophet (and cmdstanpy behind it) loads on the first fit
+prophet = LazyModule('prophet')
+
+
+def series_fingerprint(series, params):
+    """Hash an aggregated ds/y series together with the model hyperparameters"""
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(series[['ds', 'y']], index=False).values.tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class ForecastCache:
+    """Thread-safe LRU cache of forecast frames bounded by total memory"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, forecast):
+        size = int(forecast.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (forecast, size)
+            self.current_bytes += size
+            # Evict least recently used forecasts until we are back under budget
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def fit_prophet_forecast(series, periods=12, freq='M', **prophet_params):
+    """Fit Prophet on a ds/y series and forecast the next periods"""
+    model = prophet.Prophet(**prophet_params)
+    model.fit(series)
+    future = model.make_future_dataframe(periods=periods, freq=freq)
+    return model.predict(future)
+
+
+def forecast_cache_key(series, periods=12, freq='M', **prophet_params):
+    """Cache key for a forecast of series with the given horizon and hyperparameters"""
+    return series_fingerprint(series, dict(prophet_params, periods=periods, freq=freq))
+
+
+FORECAST_COLUMNS = ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+
+# Fewest monthly points a per-group series needs to be forecast. Filtered
+# per-property series are short: a year of history with a minimum ROI set
+# often leaves only 6-8 months per property.
+GROUP_MIN_POINTS = 6
+
+
+def group_series(data, by, value='roi'):
+    """Split a history frame into one monthly ds/y series per value of column by"""
+    monthly = data.groupby([by, 'date'], observed=True)[value].mean().reset_index()
+    monthly.columns = [by, 'ds', 'y']
+    return {group: frame[['ds', 'y']].reset_index(drop=True) for group, frame in monthly.groupby(by, observed=True)}
+
+
+def warm_start_params(model):
+    """Extract fitted Prophet parameters in the shape expected by fit(init=...)"""
+    params = {}
+    for name in ['k', 'm', 'sigma_obs']:
+        params[name] = model.params[name][0][0]
+    for name in ['delta', 'beta']:
+        params[name] = model.params[name][0]
+    return params
+
+
+def fit_prophet_batch(series_by_group, by, init=None, periods=12, freq='M', **prophet_params):
+    """Fit one Prophet model per series and return their forecasts as one long frame.
+
+    All fits in the batch share a warm-start initialisation: init if given,
+    otherwise the parameters of the first model fitted cold. A series whose
+    shape does not match the shared init (e.g. fewer changepoints) is refit cold.
+    """
+    frames = []
+    for group, series in series_by_group.items():
+        model = None
+        if init is not None:
+            try:
+                model = prophet.Prophet(**prophet_params).fit(series, init=init)
+            except Exception:
+                model = None
+        if model is None:
+            model = prophet.Prophet(**prophet_params).fit(series)
+            if init is None:
+                init = warm_start_params(model)
+        forecast = model.predict(model.make_future_dataframe(periods=periods, freq=freq))[FORECAST_COLUMNS]
+        forecast.insert(0, by, group)
+        frames.append(forecast)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _gather_batches(futures, by, cached_frames, cache, cache_keys):
+    """Combine batch futures into a single future of one long forecast frame"""
+    gathered = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _on_batch_done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            frames = list(cached_frames)
+            for future in futures:
+                batch = future.result()
+                for group, forecast in batch.groupby(by, sort=False):
+                    forecast = forecast.reset_index(drop=True)
+                    cache.put(cache_keys[group], forecast)
+                    frames.append(forecast)
+            gathered.set_result(pd.concat(frames, ignore_index=True))
+        except InvalidStateError:
+            pass  # the gathered job was cancelled while its batches ran
+        except BaseException as exc:
+            try:
+                gathered.set_exception(exc)
+            except InvalidStateError:
+                pass
+
+    def _on_gathered_done(future):
+        if future.cancelled():
+            for batch in futures:
+                batch.cancel()
+
+    gathered.add_done_callback(_on_gathered_done)
+    for future in futures:
+        future.add_done_callback(_on_batch_done)
+    return gathered
+
+
+def forecast_groups(data, by, service, cache, periods=12, freq='M', min_points=GROUP_MIN_POINTS, init=None, **prophet_params):
+    """Forecast every value of column by in parallel and return a future of the long forecast frame.
+
+    Groups with fewer than min_points months are skipped, and groups whose
+    series is already in cache are not refitted. The remaining
+    series are split into one batch per pool worker so each worker pays the
+    Prophet start-up cost once and can warm-start the rest of its batch.
+    """
+    cached_frames = []
+    pending = {}
+    cache_keys = {}
+    for group, series in group_series(data, by).items():
+        if len(series) < min_points:
+            continue
+        key = forecast_cache_key(series, periods=periods, freq=freq, **prophet_params)
+        cache_keys[group] = key
+        forecast = cache.get(key)
+        if forecast is None:
+            pending[group] = series
+        else:
+            forecast = forecast[FORECAST_COLUMNS].copy()
+            forecast.insert(0, by, group)
+            cached_frames.append(forecast)
+
+    groups = list(pending)
+    n_batches = min(len(groups), service.max_workers)
+    futures = [
+        service.submit(
+            fit_prophet_batch,
+            {group: pending[group] for group in groups[i::n_batches]},
+            by,
+            init=init,
+            periods=periods,
+            freq=freq,
+            **prophet_params
+        )
+        for i in range(n_batches)
+    ]
+    if not futures:
+        gathered = Future()
+        gathered.set_result(pd.concat(cached_frames, ignore_index=True) if cached_frames else pd.DataFrame(columns=[by] + FORECAST_COLUMNS))
+        return gathered
+    return _gather_batches(futures, by, cached_frames, cache, cache_keys)
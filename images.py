@@ -0,0 +1,198 @@
+"""Property image cache: content-addressed files on disk, thumbnails, and an in-memory LRU"""
+import hashlib
+import io
+import os
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from PIL import Image
+
+
+class HttpImageSource:
+    """Fetches image bytes over HTTP(S)"""
+
+    def __init__(self, timeout=5):
+        self.timeout = timeout
+
+    def fetch(self, url):
+        with urllib.request.urlopen(url, timeout=self.timeout) as response:
+            return response.read()
+
+
+class PlaceholderImageSource:
+    """Draws a deterministic local image per URL; the offline fallback and a test stand-in"""
+
+    def __init__(self, size=(400, 300)):
+        self.size = size
+
+    def fetch(self, url):
+        digest = hashlib.sha256(url.encode()).digest()
+        image = Image.linear_gradient('L').resize(self.size)
+        image = Image.merge('RGB', [
+            image.point(lambda v, c=c: (v * c) // 255) for c in (digest[0] | 64, digest[1] | 64, digest[2] | 64)
+        ])
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=85)
+        return buffer.getvalue()
+
+
+class ImageCache:
+    """Resolves image URLs to thumbnail bytes.
+
+    Originals are stored once per distinct content under objects/<sha256>,
+    a small refs/ file maps each URL to its content hash, and thumbnails are
+    generated with Pillow next to the original. Hot thumbnails are also kept
+    in a byte-bounded LRU so card renders do not touch the disk. Images that
+    are not stored yet are only ever fetched by the background warmer.
+    """
+
+    def __init__(self, root, source=None, fallback=None, max_memory_bytes=16 * 1024 * 1024, retry_after=300):
+        self.root = root
+        self.source = source or HttpImageSource()
+        self.fallback = fallback or PlaceholderImageSource()
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_bytes = 0
+        self.retry_after = retry_after
+        self._failed = {}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._warmer = None
+        self._pending = {}
+        # Drawn once per URL and width rather than on every render of an uncached card
+        self.placeholder = lru_cache(maxsize=1024)(self._draw_placeholder)
+        for sub in ('objects', 'refs', 'thumbs'):
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+
+    def _path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _stored(self, url):
+        """Content hash of url's image if it is already on disk, else None"""
+        ref_path = self._path('refs', hashlib.sha256(url.encode()).hexdigest())
+        try:
+            with open(ref_path) as f:
+                content_hash = f.read().strip()
+        except OSError:
+            return None
+        return content_hash if os.path.exists(self._path('objects', content_hash)) else None
+
+    def original(self, url):
+        """Content hash of url's image, fetching and storing it on first use.
+
+        Returns None when the source fails. Failures are remembered for
+        retry_after seconds so an offline source does not stall every render.
+        """
+        content_hash = self._stored(url)
+        if content_hash is not None:
+            return content_hash
+        with self._lock:
+            failed_at = self._failed.get(url)
+        if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+            return None
+        try:
+            data = self.source.fetch(url)
+        except Exception:
+            with self._lock:
+                self._failed[url] = time.monotonic()
+            return None
+        with self._lock:
+            self._failed.pop(url, None)
+        content_hash = hashlib.sha256(data).hexdigest()
+        object_path = self._path('objects', content_hash)
+        if not os.path.exists(object_path):
+            self._write_atomic(object_path, data)
+        self._write_atomic(self._path('refs', hashlib.sha256(url.encode()).hexdigest()), content_hash.encode())
+        return content_hash
+
+    def _thumbnail_from_disk(self, content_hash, width):
+        thumb_path = self._path('thumbs', f'{content_hash}_{width}.jpg')
+        try:
+            with open(thumb_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            pass
+        with open(self._path('objects', content_hash), 'rb') as f:
+            data = make_thumbnail(f.read(), width)
+        self._write_atomic(thumb_path, data)
+        return data
+
+    def thumbnail(self, url, width=200, wait=False):
+        """JPEG thumbnail bytes for url from memory or disk.
+
+        On a miss the image is fetched by the warmer and a placeholder is
+        returned, so a render never blocks on the source; wait=True fetches
+        on the calling thread instead.
+        """
+        key = (url, width)
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+
+        content_hash = self._stored(url)
+        if content_hash is None and wait:
+            content_hash = self.original(url)
+        if content_hash is None:
+            if not wait:
+                self.warm([url], width)
+            # Serve a placeholder without storing it, so the real image replaces it later
+            return self.placeholder(url, width)
+        data = self._thumbnail_from_disk(content_hash, width)
+
+        with self._lock:
+            if key not in self._memory and len(data) <= self.max_memory_bytes:
+                self._memory[key] = data
+                self.memory_bytes += len(data)
+                while self.memory_bytes > self.max_memory_bytes:
+                    _, evicted = self._memory.popitem(last=False)
+                    self.memory_bytes -= len(evicted)
+        return data
+
+    def _draw_placeholder(self, url, width):
+        return make_thumbnail(self.fallback.fetch(url), width)
+
+    def warm(self, urls, width=200, max_workers=4):
+        """Fetch and thumbnail urls in the background; a URL already being fetched is not queued again"""
+        futures, submitted = [], []
+        with self._lock:
+            if self._warmer is None:
+                self._warmer = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-warm')
+            for url in urls:
+                key = (url, width)
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pending[key] = self._warmer.submit(self.thumbnail, url, width, True)
+                    submitted.append((key, future))
+                futures.append(future)
+        # Outside the lock: a future that already finished runs its callback right here
+        for key, future in submitted:
+            future.add_done_callback(lambda f, key=key: self._finish_warm(key, f))
+        return futures
+
+    def _finish_warm(self, key, future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+
+def make_thumbnail(data, width):
+    """Downscale image bytes to the given width and re-encode as JPEG"""
+    image = Image.open(io.BytesIO(data))
+    image.thumbnail((width, width * 4))
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=85)
+    return buffer.getvalue()
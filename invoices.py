@@ -0,0 +1,309 @@
+"""PDF investment invoices: single rendering and a batch engine for month-end runs"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import mmap
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import datetime
+from functools import lru_cache
+
+from profiling import profiled
+from startup import LazyModule
+
+# ReportLab loads with the first invoice
+colors = LazyModule('reportlab.lib.colors')
+pagesizes = LazyModule('reportlab.lib.pagesizes')
+lib_styles = LazyModule('reportlab.lib.styles')
+units = LazyModule('reportlab.lib.units')
+platypus = LazyModule('reportlab.platypus')
+
+TERMS = """
+    This investment represents ownership of digital tokens backed by real estate assets.
+    Tokens are secured on the blockchain and provide proportional ownership rights.
+    Returns are subject to property performance and market conditions.
+    """
+
+
+@lru_cache(maxsize=1)
+def invoice_styles():
+    """Paragraph and table styles, built once per process and shared by every invoice"""
+    styles = lib_styles.getSampleStyleSheet()
+    title_style = lib_styles.ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=1
+    )
+    table_style = platypus.TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('BACKGROUND', (1, 0), (1, -1), colors.beige),
+    ])
+    return {
+        'title': title_style,
+        'heading': styles['Heading2'],
+        'normal': styles['Normal'],
+        'table': table_style
+    }
+
+
+@profiled('invoices.create_pdf')
+def create_pdf_invoice(property_name, investment_amount, tokens, ownership_percent, roi, invoice_number=None, issued_at=None):
+    """Create a professional PDF invoice"""
+    issued_at = issued_at or datetime.now()
+    invoice_number = invoice_number or f'INV-{issued_at.strftime("%Y%m%d%H%M%S")}'
+    styles = invoice_styles()
+
+    buffer = io.BytesIO()
+    doc = platypus.SimpleDocTemplate(buffer, pagesize=pagesizes.letter)
+
+    # Content
+    story = []
+
+    # Title
+    story.append(platypus.Paragraph("PropToken Investment Invoice", styles['title']))
+    story.append(platypus.Spacer(1, 20))
+
+    # Invoice details
+    invoice_data = [
+        ['Invoice Number:', invoice_number],
+        ['Date:', issued_at.strftime("%B %d, %Y")],
+        ['Property:', property_name],
+        ['Investment Amount:', f'${investment_amount:,.2f}'],
+        ['Tokens Issued:', f'{tokens:,.0f}'],
+        ['Ownership Percentage:', f'{ownership_percent:.2f}%'],
+        ['Expected ROI:', f'{roi:.2f}%'],
+    ]
+
+    table = platypus.Table(invoice_data, colWidths=[2*units.inch, 3*units.inch])
+    table.setStyle(styles['table'])
+
+    story.append(table)
+    story.append(platypus.Spacer(1, 30))
+
+    # Terms and conditions
+    story.append(platypus.Paragraph("Terms and Conditions", styles['heading']))
+    story.append(platypus.Paragraph(TERMS, styles['normal']))
+
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+
+class InvoiceStore:
+    """Rendered invoices stored once per distinct PDF under <root>/<sha256>.pdf.
+
+    Sessions hold only the hash handle. Files older than max_age seconds are
+    evicted, then the least recently written ones until the store fits in
+    max_bytes.
+    """
+
+    def __init__(self, root, max_bytes=256 * 1024 * 1024, max_age=7 * 24 * 3600):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, handle):
+        return os.path.join(self.root, handle + '.pdf')
+
+    def put(self, data):
+        """Store PDF bytes and return their handle"""
+        handle = hashlib.sha256(data).hexdigest()
+        path = self._path(handle)
+        if os.path.exists(path):
+            # Refresh the timestamp so a re-issued invoice is not the next one evicted
+            os.utime(path)
+        else:
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        self.evict()
+        return handle
+
+    def read(self, handle):
+        """PDF bytes for handle via a memory-mapped read, or None once it has been evicted"""
+        try:
+            with open(self._path(handle), 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return mapped[:]
+        except (OSError, ValueError):
+            return None
+
+    def evict(self):
+        """Drop expired invoices, then the oldest ones while the store is over quota"""
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry in os.scandir(self.root):
+                if not entry.name.endswith('.pdf'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            for mtime, size, path in entries:
+                if now - mtime <= self.max_age and total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+            return total
+
+
+class InvoiceQueue:
+    """Background workers that render single invoices off the Streamlit script thread"""
+
+    def __init__(self, store, max_workers=2):
+        self.store = store
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='invoice')
+
+    def submit(self, property_name, investment_amount, tokens, ownership_percent, roi, invoice_number=None, issued_at=None):
+        """Queue one invoice; the returned future resolves to its InvoiceStore handle"""
+        # Stamp the issue time now so the invoice reflects the submit, not the render
+        issued_at = issued_at or datetime.now()
+        return self._executor.submit(
+            lambda: self.store.put(create_pdf_invoice(
+                property_name, investment_amount, tokens, ownership_percent, roi,
+                invoice_number=invoice_number, issued_at=issued_at
+            ).getvalue())
+        )
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def render_invoice_chunk(invoices):
+    """Render a chunk of invoice dicts in a worker; returns (invoice_number, pdf bytes, seconds) tuples"""
+    results = []
+    for invoice in invoices:
+        started = time.perf_counter()
+        pdf = create_pdf_invoice(
+            invoice['property_name'],
+            float(invoice['investment_amount']),
+            float(invoice['tokens']),
+            float(invoice['ownership_percent']),
+            float(invoice['roi']),
+            invoice_number=invoice['invoice_number']
+        ).getvalue()
+        results.append((invoice['invoice_number'], pdf, time.perf_counter() - started))
+    return results
+
+
+class _DirectoryWriter:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, name, data):
+        with open(os.path.join(self.path, name), 'wb') as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+
+class _ZipWriter:
+    def __init__(self, path):
+        # PDFs are already compressed, so store them as-is
+        self.archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED)
+
+    def write(self, name, data):
+        self.archive.writestr(name, data)
+
+    def close(self):
+        self.archive.close()
+
+
+def generate_invoice_batch(invoices, output, max_workers=None, chunk_size=32):
+    """Render many invoices in a process pool and stream them to a directory or a .zip archive.
+
+    invoices is any iterable of dicts with property_name, investment_amount,
+    tokens, ownership_percent and roi (invoice_number is optional). At most
+    two chunks per worker are in flight, so memory stays flat however long
+    the batch is. Returns a report with per-invoice render times.
+    """
+    writer = _ZipWriter(output) if output.endswith('.zip') else _DirectoryWriter(output)
+    timings = []
+    started = time.perf_counter()
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        max_in_flight = 2 * max_workers
+        pending = set()
+
+        def drain():
+            nonlocal pending
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for invoice_number, pdf, seconds in future.result():
+                    writer.write(f'{invoice_number}.pdf', pdf)
+                    timings.append({'invoice_number': invoice_number, 'seconds': seconds})
+
+        chunk = []
+        for sequence, invoice in enumerate(invoices, start=1):
+            invoice = dict(invoice)
+            if not invoice.get('invoice_number'):
+                invoice['invoice_number'] = f'INV-{datetime.now().strftime("%Y%m%d")}-{sequence:06d}'
+            chunk.append(invoice)
+            if len(chunk) == chunk_size:
+                pending.add(executor.submit(render_invoice_chunk, chunk))
+                chunk = []
+                if len(pending) >= max_in_flight:
+                    drain()
+        if chunk:
+            pending.add(executor.submit(render_invoice_chunk, chunk))
+        while pending:
+            drain()
+    writer.close()
+
+    elapsed = time.perf_counter() - started
+    seconds = sorted(t['seconds'] for t in timings)
+    return {
+        'count': len(timings),
+        'elapsed_seconds': elapsed,
+        'invoices_per_second': len(timings) / elapsed if elapsed else 0.0,
+        'mean_seconds': sum(seconds) / len(seconds) if seconds else 0.0,
+        'p95_seconds': seconds[int(0.95 * (len(seconds) - 1))] if seconds else 0.0,
+        'timings': timings
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render PropToken invoices in bulk from a CSV of investments")
+    parser.add_argument('input', help="CSV with property_name, investment_amount, tokens, ownership_percent, roi[, invoice_number]")
+    parser.add_argument('output', help="Output directory, or a path ending in .zip")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=32)
+    parser.add_argument('--report', help="Write the full report, including per-invoice timings, to this JSON file")
+    args = parser.parse_args()
+
+    with open(args.input, newline='') as f:
+        report = generate_invoice_batch(csv.DictReader(f), args.output, max_workers=args.workers, chunk_size=args.chunk_size)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+    summary = {key: value for key, value in report.items() if key != 'timings'}
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Token inventory ledger: atomic reserve/commit/release of property tokens on the SQLite store"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from storage import Storage
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_reservations (
+    id TEXT PRIMARY KEY,
+    property_id TEXT NOT NULL,
+    tokens REAL NOT NULL,
+    state TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS token_reservations_held ON token_reservations (state, created_at);
+"""
+
+# The availability check and the decrement are one statement, so two buyers
+# can never both take the last tokens
+TAKE_TOKENS = "UPDATE properties SET tokens_available = tokens_available - ? WHERE id = ? AND tokens_available >= ?"
+RETURN_TOKENS = "UPDATE properties SET tokens_available = tokens_available + ? WHERE id = ?"
+INSERT_RESERVATION = "INSERT INTO token_reservations (id, property_id, tokens, state, created_at) VALUES (?, ?, ?, 'held', ?)"
+SELECT_HELD = "SELECT property_id, tokens FROM token_reservations WHERE id = ? AND state = 'held'"
+SET_STATE = "UPDATE token_reservations SET state = ? WHERE id = ? AND state = 'held'"
+COMMIT_HELD = "UPDATE token_reservations SET state = 'committed' WHERE id = ? AND state = 'held' AND created_at >= ?"
+SELECT_EXPIRED = "SELECT id FROM token_reservations WHERE state = 'held' AND created_at < ?"
+
+
+class InsufficientTokens(ValueError):
+    """Raised when a property has fewer tokens available than requested"""
+
+
+class TokenLedger:
+    """Per-property token inventory kept in the properties table of a Storage.
+
+    reserve() takes tokens out of tokens_available and records a held
+    reservation; commit() makes it final and release() puts the tokens back.
+    Each step is a single write transaction, so the inventory never goes
+    negative however many sessions or threads buy at once. Reservations
+    still held after ttl seconds (an abandoned checkout) can no longer be
+    committed, and reserve() and available() return their tokens first.
+    """
+
+    def __init__(self, storage, ttl=15 * 60):
+        self.storage = storage
+        self.ttl = ttl
+        with storage.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def reserve(self, property_id, tokens):
+        """Hold tokens of property_id and return the reservation id"""
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        self.release_expired()
+        reservation_id = uuid.uuid4().hex
+        with self.storage.pool.transaction() as connection:
+            if connection.execute(TAKE_TOKENS, (tokens, property_id, tokens)).rowcount == 0:
+                raise InsufficientTokens(f"Not enough tokens available for {property_id}")
+            connection.execute(INSERT_RESERVATION, (reservation_id, property_id, tokens, time.time()))
+        return reservation_id
+
+    def commit(self, reservation_id):
+        """Finalise a held reservation; False if it was already committed, released or expired"""
+        with self.storage.pool.transaction() as connection:
+            return connection.execute(COMMIT_HELD, (reservation_id, time.time() - self.ttl)).rowcount == 1
+
+    def release(self, reservation_id):
+        """Return a held reservation's tokens to the property; False if it was no longer held"""
+        with self.storage.pool.transaction() as connection:
+            held = connection.execute(SELECT_HELD, (reservation_id,)).fetchone()
+            if held is None:
+                return False
+            property_id, tokens = held
+            connection.execute(SET_STATE, ('released', reservation_id))
+            connection.execute(RETURN_TOKENS, (tokens, property_id))
+        return True
+
+    def release_expired(self):
+        """Release every reservation held for longer than ttl; returns how many were released"""
+        with self.storage.pool.connection() as connection:
+            expired = [row[0] for row in connection.execute(SELECT_EXPIRED, (time.time() - self.ttl,))]
+        return sum(self.release(reservation_id) for reservation_id in expired)
+
+    def available(self, property_ids):
+        """property_id -> tokens currently available"""
+        property_ids = list(property_ids)
+        if not property_ids:
+            return {}
+        self.release_expired()
+        with self.storage.pool.connection() as connection:
+            rows = connection.execute(
+                f"SELECT id, tokens_available FROM properties WHERE id IN ({', '.join('?' for _ in property_ids)})",
+                property_ids
+            ).fetchall()
+        return dict(rows)
+
+
+def stress(threads=32, purchases=2000, tokens_available=500, pool_size=8, release_rate=0.2, seed=0):
+    """Hammer one property from many threads and check that it is never oversold.
+
+    Each purchase reserves 1-5 tokens and then commits, or releases with
+    probability release_rate. Returns throughput and the final inventory
+    check as a report dict.
+    """
+    with tempfile.TemporaryDirectory(prefix='ledger-stress-') as root:
+        storage = Storage(os.path.join(root, 'ledger.db'), pool_size=pool_size)
+        storage.add_property({
+            'id': None, 'name': 'Stress Tower', 'location': 'Karachi', 'price': 10000000, 'roi': 15.0,
+            'tokens_supply': tokens_available, 'tokens_available': tokens_available, 'image_url': '',
+            'description': '', 'property_type': 'Residential', 'year_built': 2020, 'square_feet': 5000
+        })
+        ledger = TokenLedger(storage)
+        property_id = 'PROP_001'
+        rng = random.Random(seed)
+        plan = [(rng.randint(1, 5), rng.random() < release_rate) for _ in range(purchases)]
+        outcome = {'committed': 0, 'released': 0, 'rejected': 0}
+        lock = threading.Lock()
+        latencies = []
+
+        def purchase(step):
+            tokens, abandon = step
+            started = time.perf_counter()
+            try:
+                reservation_id = ledger.reserve(property_id, tokens)
+            except InsufficientTokens:
+                result, sold = 'rejected', 0
+            else:
+                if abandon:
+                    ledger.release(reservation_id)
+                    result, sold = 'released', 0
+                else:
+                    ledger.commit(reservation_id)
+                    result, sold = 'committed', tokens
+            with lock:
+                outcome[result] += sold if result == 'committed' else 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(purchase, plan))
+        elapsed = time.perf_counter() - started
+
+        remaining = ledger.available([property_id])[property_id]
+        storage.close()
+    latencies.sort()
+    return {
+        'threads': threads,
+        'purchases': purchases,
+        'elapsed_seconds': elapsed,
+        'purchases_per_second': purchases / elapsed if elapsed else 0.0,
+        'p95_seconds': latencies[int(0.95 * (len(latencies) - 1))],
+        'tokens_initial': tokens_available,
+        'tokens_sold': outcome['committed'],
+        'tokens_remaining': remaining,
+        'released': outcome['released'],
+        'rejected': outcome['rejected'],
+        'oversold': outcome['committed'] > tokens_available or remaining < 0,
+        'balanced': outcome['committed'] + remaining == tokens_available
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress the token ledger with concurrent purchases of one property")
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--purchases', type=int, default=2000)
+    parser.add_argument('--tokens', type=int, default=500, help="Tokens available at the start")
+    parser.add_argument('--pool-size', type=int, default=8)
+    args = parser.parse_args()
+
+    report = stress(threads=args.threads, purchases=args.purchases, tokens_available=args.tokens, pool_size=args.pool_size)
+    print(json.dumps(report, indent=2))
+    if report['oversold'] or not report['balanced']:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""On-disk registry of trained XGBoost models in XGBoost's native binary format"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from startup import LazyModule
+
+xgb = LazyModule('xgboost')
+
+
+class ModelRegistry:
+    """Trained boosters saved as <key>.ubj with a <key>.json metadata sidecar.
+
+    Models are kept in memory once loaded, so a registry shared through
+    st.cache_resource serves every session without touching the disk again.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._models = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(features, dataset_version, data_fingerprint=None, params=None):
+        """Registry key for a model trained on a dataset version, feature set and training data"""
+        payload = json.dumps({
+            'features': list(features),
+            'data': data_fingerprint,
+            'dataset_version': dataset_version,
+            'params': params or {}
+        }, sort_keys=True)
+        return 'xgboost-' + hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def _paths(self, key):
+        return os.path.join(self.root, key + '.ubj'), os.path.join(self.root, key + '.json')
+
+    def save(self, key, model_raw, metadata):
+        """Persist a booster's raw UBJSON bytes and its metadata, then keep it in memory"""
+        model_path, meta_path = self._paths(key)
+        model_raw = bytes(model_raw)
+        metadata = dict(
+            metadata,
+            key=key,
+            sha256=hashlib.sha256(model_raw).hexdigest(),
+            saved_at=datetime.now().isoformat(),
+            xgboost_version=xgb.__version__
+        )
+        # Write to temporary files first so readers never see a half-written model
+        for path, data in ((model_path, model_raw), (meta_path, json.dumps(metadata, indent=2).encode())):
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._models[key] = (self._booster_from_raw(model_raw), metadata)
+        return metadata
+
+    def get(self, key):
+        """Return (booster, metadata) for key, loading it from disk on first use"""
+        with self._lock:
+            entry = self._models.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                with self._lock:
+                    self._models[key] = entry
+        return entry
+
+    def _load(self, key):
+        model_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                metadata = json.load(f)
+            with open(model_path, 'rb') as f:
+                model_raw = f.read()
+        except (OSError, ValueError):
+            return None
+        # A model whose bytes do not match its metadata is treated as absent
+        if hashlib.sha256(model_raw).hexdigest() != metadata.get('sha256'):
+            return None
+        try:
+            return self._booster_from_raw(model_raw), metadata
+        except xgb.core.XGBoostError:
+            return None
+
+    @staticmethod
+    def _booster_from_raw(model_raw):
+        booster = xgb.Booster()
+        booster.load_model(bytearray(model_raw))
+        return booster
+
+    def entries(self):
+        """Metadata for every model on disk, newest first"""
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.root, name)) as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(entries, key=lambda meta: meta.get('saved_at', ''), reverse=True)
+
+    def prune(self, keep):
+        """Delete every model on disk or in memory whose key is not in keep; return the deleted keys"""
+        keep = set(keep)
+        deleted = set()
+        for name in os.listdir(self.root):
+            key, extension = os.path.splitext(name)
+            if extension in ('.ubj', '.json') and key not in keep:
+                try:
+                    os.remove(os.path.join(self.root, name))
+                except OSError:
+                    continue
+                deleted.add(key)
+        with self._lock:
+            for key in list(self._models):
+                if key not in keep:
+                    del self._models[key]
+        return sorted(deleted)
@@ -0,0 +1,109 @@
+"""Rerun-cost profiler: wall time, CPU time and allocation deltas per named section"""
+import json
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+
+class Profiler:
+    """Rolling in-memory store of section timings, shared by every session in the process.
+
+    CPU time is the calling thread's, so it is not inflated by other sessions.
+    Allocation deltas are only recorded while tracemalloc is tracing (see
+    track_allocations) and are process-wide, so they include whatever other
+    threads allocated during the section.
+    """
+
+    def __init__(self, max_records=2000):
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def section(self, name):
+        tracing = tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if tracing else None
+        started_at = time.time()
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(
+                name,
+                wall_seconds=time.perf_counter() - wall,
+                cpu_seconds=time.thread_time() - cpu,
+                alloc_bytes=tracemalloc.get_traced_memory()[0] - allocated if tracing and tracemalloc.is_tracing() else None,
+                started_at=started_at
+            )
+
+    def profiled(self, name):
+        """Decorator that runs the function inside section(name)"""
+        def decorate(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.section(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, name, wall_seconds, cpu_seconds=None, alloc_bytes=None, started_at=None):
+        """Add a measurement taken elsewhere, e.g. a fit time reported by a worker process"""
+        with self._lock:
+            self._records.append({
+                'section': name,
+                'started_at': started_at or time.time(),
+                'wall_seconds': wall_seconds,
+                'cpu_seconds': cpu_seconds,
+                'alloc_bytes': alloc_bytes,
+                'thread': threading.current_thread().name
+            })
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def summary(self):
+        """Per-section count, mean/p95/max wall time, mean CPU time and mean allocation, slowest first"""
+        sections = {}
+        for entry in self.records():
+            sections.setdefault(entry['section'], []).append(entry)
+        summary = []
+        for name, entries in sections.items():
+            walls = sorted(entry['wall_seconds'] for entry in entries)
+            cpus = [entry['cpu_seconds'] for entry in entries if entry['cpu_seconds'] is not None]
+            allocs = [entry['alloc_bytes'] for entry in entries if entry['alloc_bytes'] is not None]
+            summary.append({
+                'section': name,
+                'count': len(entries),
+                'mean_wall_seconds': sum(walls) / len(walls),
+                'p95_wall_seconds': walls[int(0.95 * (len(walls) - 1))],
+                'max_wall_seconds': walls[-1],
+                'mean_cpu_seconds': sum(cpus) / len(cpus) if cpus else None,
+                'mean_alloc_bytes': sum(allocs) / len(allocs) if allocs else None
+            })
+        return sorted(summary, key=lambda entry: entry['mean_wall_seconds'] * entry['count'], reverse=True)
+
+    def export_json(self):
+        """Summary and raw records as a JSON document"""
+        return json.dumps({'exported_at': time.time(), 'summary': self.summary(), 'records': self.records()}, indent=2)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+
+def track_allocations(enabled):
+    """Start or stop tracemalloc; allocation deltas are only recorded while it runs"""
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+# Process-wide profiler used by the pages and the invoice renderer
+PROFILER = Profiler()
+profile_section = PROFILER.section
+profiled = PROFILER.profiled
@@ -0,0 +1,214 @@
+"""Process-wide resources shared by every page: storage, caches, worker pools and datasets"""
+import streamlit as st
+import os
+import random
+import uuid
+from historical_data import generate_historical_panel
+from forecasting import ForecastCache
+from training import TrainingService
+from model_registry import ModelRegistry
+from features import FEATURE_COLUMNS, build_feature_matrix
+from catalogue import PropertyCatalogue, SharedCatalogue
+from images import ImageCache
+from invoices import InvoiceQueue, InvoiceStore
+from storage import Storage
+from ledger import TokenLedger
+from kyc import DocumentSpool, KYCQueue, StubVerifier
+
+def generate_dummy_properties(seed=None):
+    """Generate dummy property data"""
+    rng = random.Random(seed)
+    properties = []
+    locations = ['Karachi', 'Lahore', 'Islamabad', 'Rawalpindi', 'Faisalabad', 'Multan', 'Peshawar', 'Quetta', 'Gujranwala', 'Sialkot']
+    
+    # Pakistani property names
+    property_names = [
+        'Centaurus Mall', 'Bahria Town Plaza', 'DHA Phase 5 Tower', 'Gulberg Heights', 
+        'Clifton Beach Resort', 'F-8 Commercial Complex', 'Model Town Plaza', 'Defence Tower',
+        'Blue Area Office Complex', 'Garden City Residency', 'Lucky One Mall', 'Dolmen City',
+        'Emporium Mall Tower', 'Packages Mall Complex', 'Fortress Square', 'Giga Mall',
+        'Centaurus Residency', 'Bahria Icon Tower', 'DHA Phase 2 Plaza', 'Gulberg Greens'
+    ]
+    
+    for i in range(20):
+        property_data = {
+            'id': f'PROP_{i+1:03d}',
+            'name': property_names[i],
+            'location': rng.choice(locations),
+            'price': rng.randint(5000000, 50000000),  # Prices in PKR (5M to 50M PKR)
+            'roi': round(rng.uniform(12, 30), 2),  # Higher ROI for Pakistani market
+            'tokens_supply': rng.randint(1000, 10000),
+            'tokens_available': rng.randint(100, 1000),
+            'image_url': f'https://picsum.photos/400/300?random={i}',
+            'description': f"Premium {rng.choice(['residential', 'commercial', 'mixed-use'])} property in {rng.choice(locations)}. Modern amenities, prime location, excellent investment opportunity.",
+            'property_type': rng.choice(['Residential', 'Commercial', 'Mixed-Use']),
+            'year_built': rng.randint(2000, 2024),
+            'square_feet': rng.randint(2000, 50000)
+        }
+        properties.append(property_data)
+    
+    return properties
+
+# Listings, investments and portfolios persist here across sessions and restarts
+STORAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'proptoken.db')
+
+@st.cache_resource(show_spinner=False)
+def get_storage(path=STORAGE_PATH):
+    """Process-wide SQLite storage, seeded with the demo catalogue on first use"""
+    storage = Storage(path)
+    storage.seed_properties(f'demo-{PROPERTY_CATALOGUE_SEED}', lambda: generate_dummy_properties(seed=PROPERTY_CATALOGUE_SEED))
+    return storage
+
+@st.cache_resource(show_spinner=False)
+def get_shared_catalogue(path=STORAGE_PATH):
+    """Process-wide marketplace catalogue loaded from storage; sessions read its snapshots"""
+    catalogue = PropertyCatalogue(get_storage(path).load_properties())
+    # Pre-generate card thumbnails in the background
+    get_image_cache().warm(catalogue.frame['image_url'])
+    return SharedCatalogue(catalogue)
+
+@st.cache_resource(show_spinner=False)
+def get_token_ledger(path=STORAGE_PATH):
+    """Process-wide token ledger; reservations abandoned before a restart are returned on startup"""
+    ledger = TokenLedger(get_storage(path))
+    ledger.release_expired()
+    return ledger
+
+def session_user_id():
+    """Anonymous account for this browser session, created on first use"""
+    if 'session_user_id' not in st.session_state:
+        st.session_state.session_user_id = f'session-{uuid.uuid4().hex}'
+    return st.session_state.session_user_id
+
+def current_user_id():
+    """Investments are filed under the session's own account until KYC verification claims one"""
+    return st.session_state.kyc_status.get('account_id') or session_user_id()
+
+def claim_verified_account(email):
+    """Move this session's investments to the account of a just-verified email.
+
+    The email is not authenticated, so the account goes to the first session
+    that verifies it; returns False, leaving this session on its own account,
+    when another session already holds it.
+    """
+    account_id = f'kyc:{email.strip().lower()}'
+    if not get_storage().claim_account(account_id, session_user_id()):
+        return False
+    st.session_state.kyc_status['account_id'] = account_id
+    return True
+
+def load_user_investments():
+    """Load the current user's investments and portfolio from storage when the user changes"""
+    user_id = current_user_id()
+    if st.session_state.get('investments_user') != user_id:
+        st.session_state.investments = get_storage().investments(user_id)
+        st.session_state.user_portfolio = get_storage().portfolio(user_id)
+        st.session_state.investments_user = user_id
+
+# Property images are cached here so cards render without network round trips
+IMAGE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.image_cache')
+
+@st.cache_resource(show_spinner=False)
+def get_image_cache(root=IMAGE_CACHE_DIR):
+    """Process-wide property image cache"""
+    return ImageCache(root)
+
+# Seed for the listed property catalogue; analytics features join on the same listings
+PROPERTY_CATALOGUE_SEED = 7
+
+# Bump HISTORICAL_DATA_VERSION whenever generate_historical_data() changes, so
+# sessions stop being served datasets built by the previous generator.
+HISTORICAL_DATA_VERSION = 2
+HISTORICAL_DATA_SEED = 42
+
+def generate_historical_data(seed=None):
+    """Generate historical ROI data for ML models"""
+    return generate_historical_panel(n_properties=20, start='2020-01-01', end='2024-12-31', seed=seed)
+
+@st.cache_resource(show_spinner=False)
+def load_historical_data(version=HISTORICAL_DATA_VERSION, seed=HISTORICAL_DATA_SEED):
+    """Historical ROI dataset shared by every session, keyed by generator version and seed.
+    
+    The frame is a process-wide singleton, so callers must treat it as read-only.
+    """
+    return generate_historical_data(seed)
+
+@st.cache_resource(show_spinner=False)
+def load_feature_matrix(version=HISTORICAL_DATA_VERSION, seed=HISTORICAL_DATA_SEED, catalogue_seed=PROPERTY_CATALOGUE_SEED):
+    """Model feature matrix for the cached historical dataset, built once per process"""
+    return build_feature_matrix(load_historical_data(version, seed), generate_dummy_properties(seed=catalogue_seed))
+
+def clear_historical_data_cache():
+    """Drop every cached historical dataset and its features; the next load regenerates them"""
+    load_historical_data.clear()
+    load_feature_matrix.clear()
+
+# Memory budget for Prophet forecasts shared across sessions
+FORECAST_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+@st.cache_resource(show_spinner=False)
+def get_forecast_cache(max_bytes=FORECAST_CACHE_MAX_BYTES):
+    """Process-wide Prophet forecast cache"""
+    return ForecastCache(max_bytes=max_bytes)
+
+# Trained XGBoost models persist here across restarts
+MODEL_REGISTRY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models')
+
+def xgboost_model_key():
+    """Registry key of the XGBoost model trained on the cached full feature matrix.
+
+    The matrix fingerprint covers the dataset and catalogue seeds, so changing
+    either retrains instead of reusing a model fitted on other data.
+    """
+    return ModelRegistry.key(FEATURE_COLUMNS, HISTORICAL_DATA_VERSION, load_feature_matrix().fingerprint)
+
+@st.cache_resource(show_spinner=False)
+def get_model_registry(root=MODEL_REGISTRY_DIR):
+    """Process-wide XGBoost model registry holding only the current dataset's model, loaded if already trained"""
+    registry = ModelRegistry(root)
+    registry.prune([xgboost_model_key()])
+    registry.get(xgboost_model_key())
+    return registry
+
+# One worker per model at minimum; extra cores parallelise per-location forecasts
+TRAINING_WORKERS = max(3, min(8, os.cpu_count() or 1))
+
+@st.cache_resource(show_spinner=False)
+def get_training_service(max_workers=TRAINING_WORKERS):
+    """Process-wide model training worker pool"""
+    return TrainingService(max_workers=max_workers)
+
+# Rendered invoices live on disk; sessions only keep a handle
+INVOICE_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.invoices')
+INVOICE_STORE_MAX_BYTES = 256 * 1024 * 1024
+INVOICE_STORE_MAX_AGE = 7 * 24 * 3600
+
+@st.cache_resource(show_spinner=False)
+def get_invoice_store(root=INVOICE_STORE_DIR):
+    """Process-wide invoice store"""
+    return InvoiceStore(root, max_bytes=INVOICE_STORE_MAX_BYTES, max_age=INVOICE_STORE_MAX_AGE)
+
+@st.cache_resource(show_spinner=False)
+def get_invoice_queue(max_workers=2):
+    """Process-wide invoice rendering queue"""
+    return InvoiceQueue(get_invoice_store(), max_workers=max_workers)
+
+# KYC uploads are spooled here by content hash
+KYC_SPOOL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.kyc_spool')
+KYC_MAX_DOCUMENT_BYTES = 10 * 1024 * 1024
+
+@st.cache_resource(show_spinner=False)
+def get_document_spool(root=KYC_SPOOL_DIR):
+    """Process-wide KYC document spool"""
+    return DocumentSpool(root, max_bytes=KYC_MAX_DOCUMENT_BYTES)
+
+# Verifier calls wait on the provider, so several can be in flight at once
+KYC_WORKERS = 8
+
+@st.cache_resource(show_spinner=False)
+def get_kyc_queue(max_workers=KYC_WORKERS):
+    """Process-wide KYC verification queue backed by the local stub verifier"""
+    return KYCQueue(StubVerifier(), max_workers=max_workers)
+
+# Sidebar profiler panel for debugging rerun costs; set PROPTOKEN_PROFILER=1 to show it
+PROFILER_PANEL = os.environ.get('PROPTOKEN_PROFILER') == '1'
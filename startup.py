@@ -0,0 +1,75 @@
+"""Deferred imports of heavy libraries, with a record of what each import cost"""
+import argparse
+import importlib
+import json
+import subprocess
+import sys
+import threading
+import time
+
+# module name -> {'seconds', 'imported_at'} for modules loaded through lazy_import()
+IMPORT_TIMES = {}
+_lock = threading.Lock()
+
+# Libraries the app defers until a page or job needs them
+HEAVY_MODULES = [
+    'prophet', 'xgboost', 'sklearn.linear_model', 'sklearn.metrics', 'sklearn.model_selection',
+    'sklearn.preprocessing', 'plotly.express', 'reportlab.platypus'
+]
+
+
+def lazy_import(name):
+    """Import name on first use and record how long it took"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        module = sys.modules.get(name)
+        if module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(name)
+            IMPORT_TIMES[name] = {'seconds': time.perf_counter() - started, 'imported_at': time.time()}
+    return module
+
+
+class LazyModule:
+    """Module stand-in that imports the real module the first time an attribute is read"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        return getattr(lazy_import(self._name), attribute)
+
+    def __repr__(self):
+        return f'<lazy module {self._name!r}>'
+
+
+def import_report():
+    """Deferred imports made by this process so far, slowest first"""
+    return sorted(
+        ({'module': name, **timing} for name, timing in IMPORT_TIMES.items()),
+        key=lambda entry: entry['seconds'],
+        reverse=True
+    )
+
+
+def cold_import_seconds(name):
+    """Wall time to import name in a fresh interpreter"""
+    code = f"import time; t = time.perf_counter(); import {name}; print(time.perf_counter() - t)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the cold import time of the app and each deferred library")
+    parser.add_argument('modules', nargs='*', default=None, help="Modules to time (default: app dependencies)")
+    args = parser.parse_args()
+
+    modules = args.modules or ['streamlit', 'pandas', 'numpy', 'streamlit_option_menu', 'PIL.Image'] + HEAVY_MODULES
+    report = [{'module': name, 'seconds': cold_import_seconds(name), 'deferred': name in HEAVY_MODULES} for name in modules]
+    print(json.dumps(sorted(report, key=lambda entry: entry['seconds'], reverse=True), indent=2))
+
+
+if __name__ == "__main__":
+    main()
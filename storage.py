@@ -0,0 +1,228 @@
+"""SQLite storage for marketplace properties, investments and portfolios"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from catalogue import CATALOGUE_COLUMNS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS properties (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    price NUMERIC NOT NULL,
+    roi REAL NOT NULL,
+    tokens_supply INTEGER NOT NULL,
+    tokens_available INTEGER NOT NULL,
+    image_url TEXT,
+    description TEXT,
+    property_type TEXT NOT NULL,
+    year_built INTEGER,
+    square_feet INTEGER
+);
+CREATE TABLE IF NOT EXISTS investments (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    property_id TEXT NOT NULL,
+    property_name TEXT NOT NULL,
+    investment_amount REAL NOT NULL,
+    tokens_received REAL NOT NULL,
+    ownership_percent REAL NOT NULL,
+    roi REAL NOT NULL,
+    platform_fee REAL NOT NULL,
+    net_investment REAL NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS investments_user ON investments (user_id, seq);
+CREATE TABLE IF NOT EXISTS portfolios (
+    user_id TEXT NOT NULL,
+    property_id TEXT NOT NULL,
+    tokens REAL NOT NULL,
+    invested REAL NOT NULL,
+    PRIMARY KEY (user_id, property_id)
+);
+CREATE TABLE IF NOT EXISTS accounts (
+    account_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    claimed_at TEXT NOT NULL
+);
+"""
+
+INVESTMENT_COLUMNS = [
+    'property_id', 'property_name', 'investment_amount', 'tokens_received', 'ownership_percent',
+    'roi', 'platform_fee', 'net_investment', 'timestamp'
+]
+
+# Statements are module constants so each pooled connection's statement
+# cache prepares them once and reuses them on every call
+SELECT_META = "SELECT value FROM meta WHERE key = ?"
+UPSERT_META = "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+SELECT_PROPERTIES = f"SELECT {', '.join(CATALOGUE_COLUMNS)} FROM properties ORDER BY seq"
+INSERT_PROPERTY = (
+    f"INSERT INTO properties ({', '.join(CATALOGUE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in CATALOGUE_COLUMNS)})"
+)
+# Seeding a different demo catalogue replaces the listings it shares ids with in place
+UPSERT_PROPERTY = (
+    f"{INSERT_PROPERTY} ON CONFLICT (id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in CATALOGUE_COLUMNS if column != 'id')
+)
+DELETE_SEED_MARKERS = "DELETE FROM meta WHERE key LIKE 'seed:%'"
+SELECT_NEXT_PROPERTY_SEQ = "SELECT COALESCE(MAX(seq), 0) + 1 FROM properties"
+SELECT_INVESTMENTS = f"SELECT {', '.join(INVESTMENT_COLUMNS)} FROM investments WHERE user_id = ? ORDER BY seq"
+INSERT_INVESTMENT = (
+    f"INSERT INTO investments (user_id, {', '.join(INVESTMENT_COLUMNS)}) "
+    f"VALUES (?, {', '.join('?' for _ in INVESTMENT_COLUMNS)})"
+)
+UPSERT_PORTFOLIO = (
+    "INSERT INTO portfolios (user_id, property_id, tokens, invested) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (user_id, property_id) DO UPDATE SET "
+    "tokens = tokens + excluded.tokens, invested = invested + excluded.invested"
+)
+SELECT_PORTFOLIO = "SELECT property_id, tokens, invested FROM portfolios WHERE user_id = ?"
+SELECT_ACCOUNT_OWNER = "SELECT owner FROM accounts WHERE account_id = ?"
+INSERT_ACCOUNT = "INSERT INTO accounts (account_id, owner, claimed_at) VALUES (?, ?, ?)"
+MOVE_INVESTMENTS = "UPDATE investments SET user_id = ? WHERE user_id = ?"
+# The WHERE clause keeps SQLite from parsing ON CONFLICT as a join constraint
+MERGE_PORTFOLIO = (
+    "INSERT INTO portfolios (user_id, property_id, tokens, invested) "
+    "SELECT ?, property_id, tokens, invested FROM portfolios WHERE user_id = ? "
+    "ON CONFLICT (user_id, property_id) DO UPDATE SET "
+    "tokens = tokens + excluded.tokens, invested = invested + excluded.invested"
+)
+DELETE_PORTFOLIO = "DELETE FROM portfolios WHERE user_id = ?"
+
+
+class ConnectionPool:
+    """A fixed set of SQLite connections in WAL mode handed out one caller at a time"""
+
+    def __init__(self, path, size=4, timeout=5.0):
+        self.path = path
+        self.size = size
+        self._idle = queue.Queue()
+        for _ in range(size):
+            # Transactions are opened explicitly, so the connection runs in autocommit mode
+            connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None, cached_statements=64)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._idle.put(connection)
+
+    @contextmanager
+    def connection(self):
+        connection = self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    @contextmanager
+    def transaction(self):
+        """A connection inside a write transaction, committed on success and rolled back on error"""
+        with self.connection() as connection:
+            # IMMEDIATE takes the write lock up front so concurrent writers queue on busy_timeout
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self):
+        for _ in range(self.size):
+            self._idle.get().close()
+
+
+class Storage:
+    """Properties, investments and per-user portfolios shared by every session and kept across restarts"""
+
+    def __init__(self, path, pool_size=4):
+        self.pool = ConnectionPool(path, size=pool_size)
+        self._seed_lock = threading.Lock()
+        with self.pool.connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def seed_properties(self, seed_key, make_records):
+        """Write make_records() once per seed_key; later calls, even after a restart, do nothing.
+
+        A new seed_key replaces the listings of the previous seed that share
+        an id with the new records, and becomes the only seed on record.
+        """
+        with self._seed_lock:
+            with self.pool.transaction() as connection:
+                if connection.execute(SELECT_META, (f'seed:{seed_key}',)).fetchone():
+                    return False
+                connection.executemany(UPSERT_PROPERTY, [
+                    tuple(record[column] for column in CATALOGUE_COLUMNS) for record in make_records()
+                ])
+                connection.execute(DELETE_SEED_MARKERS)
+                connection.execute(UPSERT_META, (f'seed:{seed_key}', datetime.now().isoformat()))
+        return True
+
+    def load_properties(self):
+        """Every listing as a DataFrame with the catalogue columns, in listing order"""
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_PROPERTIES).fetchall()
+        return pd.DataFrame(rows, columns=CATALOGUE_COLUMNS)
+
+    def add_property(self, record):
+        """Insert a listing under the next free PROP_nnn id and return it with that id"""
+        with self.pool.transaction() as connection:
+            (seq,) = connection.execute(SELECT_NEXT_PROPERTY_SEQ).fetchone()
+            record = dict(record, id=f'PROP_{seq:03d}')
+            connection.execute(INSERT_PROPERTY, tuple(record[column] for column in CATALOGUE_COLUMNS))
+        return record
+
+    def record_investment(self, user_id, investment):
+        """Store an investment and add it to the user's portfolio in one transaction"""
+        values = dict(investment, timestamp=investment['timestamp'].isoformat())
+        with self.pool.transaction() as connection:
+            connection.execute(INSERT_INVESTMENT, (user_id, *(values[column] for column in INVESTMENT_COLUMNS)))
+            connection.execute(UPSERT_PORTFOLIO, (
+                user_id, investment['property_id'], investment['tokens_received'], investment['investment_amount']
+            ))
+
+    def investments(self, user_id):
+        """The user's investments as dicts, oldest first"""
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_INVESTMENTS, (user_id,)).fetchall()
+        investments = [dict(zip(INVESTMENT_COLUMNS, row)) for row in rows]
+        for investment in investments:
+            investment['timestamp'] = datetime.fromisoformat(investment['timestamp'])
+        return investments
+
+    def portfolio(self, user_id):
+        """property_id -> {'tokens', 'invested'} totals for the user"""
+        with self.pool.connection() as connection:
+            rows = connection.execute(SELECT_PORTFOLIO, (user_id,)).fetchall()
+        return {property_id: {'tokens': tokens, 'invested': invested} for property_id, tokens, invested in rows}
+
+    def claim_account(self, account_id, owner):
+        """Move owner's investments and portfolio to account_id, claiming the account for owner.
+
+        An account belongs to the first owner that claims it. Returns False,
+        moving nothing, when another owner already has it.
+        """
+        with self.pool.transaction() as connection:
+            row = connection.execute(SELECT_ACCOUNT_OWNER, (account_id,)).fetchone()
+            if row is None:
+                connection.execute(INSERT_ACCOUNT, (account_id, owner, datetime.now().isoformat()))
+            elif row[0] != owner:
+                return False
+            connection.execute(MOVE_INVESTMENTS, (account_id, owner))
+            connection.execute(MERGE_PORTFOLIO, (account_id, owner))
+            connection.execute(DELETE_PORTFOLIO, (owner,))
+        return True
+
+    def close(self):
+        self.pool.close()
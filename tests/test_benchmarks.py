@@ -0,0 +1,38 @@
+from benchmarks import compare
+
+
+def report(calibration, **benchmarks):
+    results = [{'name': 'calibration', 'min_seconds': calibration, 'spread': 0.01}]
+    results += [{'name': name, 'min_seconds': seconds, 'spread': spread} for name, (seconds, spread) in benchmarks.items()]
+    return {'results': results}
+
+
+def regressed(comparison):
+    return [entry['name'] for entry in comparison if entry['regressed']]
+
+
+def test_slowdown_within_measured_noise_is_not_a_regression():
+    baseline = report(0.01, steady=(1.0, 0.02), noisy=(1.0, 0.2))
+    current = report(0.01, steady=(1.1, 0.02), noisy=(1.5, 0.2))
+    assert regressed(compare(current, baseline)) == []
+
+
+def test_slowdown_beyond_measured_noise_is_a_regression():
+    baseline = report(0.01, steady=(1.0, 0.02), noisy=(1.0, 0.2))
+    current = report(0.01, steady=(1.3, 0.02), noisy=(2.0, 0.2))
+    assert regressed(compare(current, baseline)) == ['steady', 'noisy']
+
+
+def test_times_are_scaled_by_the_calibration_workload():
+    baseline = report(0.01, steady=(1.0, 0.02))
+    slower_machine = report(0.02, steady=(2.0, 0.02))
+    comparison = compare(slower_machine, baseline)
+    assert regressed(comparison) == []
+    assert comparison[0]['ratio'] == 1.0
+
+
+def test_run_to_run_spread_of_the_baseline_widens_the_tolerance():
+    baseline = report(0.01, steady=(1.0, 0.02))
+    baseline['results'][1]['run_spread'] = 0.3
+    current = report(0.01, steady=(1.5, 0.02))
+    assert regressed(compare(current, baseline)) == []
@@ -0,0 +1,32 @@
+import numpy as np
+
+from catalogue import PropertyCatalogue
+
+
+def tied_catalogue(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return PropertyCatalogue.from_records({
+        'id': f'PROP_{i+1:03d}', 'name': f'Property {i+1}', 'location': 'Karachi',
+        'price': int(rng.choice([5000000, 10000000, 20000000])), 'roi': float(rng.choice([12.5, 15.0, 18.0])),
+        'tokens_supply': 1000, 'tokens_available': 100, 'image_url': '', 'description': '',
+        'property_type': 'Residential', 'year_built': int(rng.choice([2010, 2015, 2020, 2024])), 'square_feet': 5000
+    } for i in range(n))
+
+
+def test_paging_through_tied_sort_keys_visits_every_listing_once():
+    catalogue = tied_catalogue()
+    for sort_by in ('roi', 'price', 'year_built'):
+        for descending in (False, True):
+            ids = []
+            for page in range(1, 21):
+                ids += list(PropertyCatalogue.page(catalogue.frame, sort_by=sort_by, descending=descending, page=page, page_size=10)['id'])
+            assert sorted(ids) == sorted(catalogue.frame['id'])
+            values = catalogue.frame.set_index('id').loc[ids, sort_by].to_numpy()
+            assert (np.diff(values) <= 0).all() if descending else (np.diff(values) >= 0).all()
+
+
+def test_ties_keep_catalogue_order():
+    catalogue = tied_catalogue()
+    page = PropertyCatalogue.page(catalogue.frame, sort_by='roi', page=1, page_size=10)
+    expected = catalogue.frame.sort_values('roi', kind='stable').head(10)
+    assert list(page['id']) == list(expected['id'])
@@ -0,0 +1,39 @@
+from concurrent.futures import Future
+
+import pandas as pd
+
+from forecasting import ForecastCache, forecast_groups
+
+
+class RecordingService:
+    """Records submitted batches without running Prophet"""
+
+    max_workers = 2
+
+    def __init__(self):
+        self.batches = []
+
+    def submit(self, fn, series_by_group, by, **kwargs):
+        self.batches.append(series_by_group)
+        return Future()
+
+
+def history(months_by_property):
+    rows = []
+    for property_id, months in months_by_property.items():
+        for date in pd.date_range('2023-01-31', periods=months, freq='M'):
+            rows.append({'property_id': property_id, 'date': date, 'roi': 15.0})
+    return pd.DataFrame(rows)
+
+
+def test_series_with_the_minimum_number_of_months_are_forecast():
+    service = RecordingService()
+    forecast_groups(history({'PROP_001': 6, 'PROP_002': 5, 'PROP_003': 8}), 'property_id', service, ForecastCache(), min_points=6)
+    assert sorted(group for batch in service.batches for group in batch) == ['PROP_001', 'PROP_003']
+
+
+def test_no_long_enough_series_gives_an_empty_forecast_without_fitting():
+    service = RecordingService()
+    forecast = forecast_groups(history({'PROP_001': 3, 'PROP_002': 5}), 'property_id', service, ForecastCache()).result()
+    assert service.batches == [] and forecast.empty
+    assert list(forecast.columns) == ['property_id', 'ds', 'yhat', 'yhat_lower', 'yhat_upper']
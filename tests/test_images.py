@@ -0,0 +1,77 @@
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+from images import ImageCache, PlaceholderImageSource, make_thumbnail
+
+
+class StubSource:
+    """Serves generated images per URL, counting fetches; can fail or hold fetches until released"""
+
+    def __init__(self, fail=False, hold=False):
+        self.fail = fail
+        self.fetches = []
+        self.released = threading.Event()
+        if not hold:
+            self.released.set()
+        self._images = PlaceholderImageSource(size=(64, 48))
+
+    def fetch(self, url):
+        self.fetches.append(url)
+        self.released.wait(5)
+        if self.fail:
+            raise OSError('unreachable')
+        return self._images.fetch('real:' + url)
+
+
+@pytest.fixture
+def placeholder():
+    return lambda url, width=32: make_thumbnail(PlaceholderImageSource().fetch(url), width)
+
+
+def test_miss_serves_a_placeholder_while_the_warmer_fetches(tmp_path, placeholder):
+    source = StubSource(hold=True)
+    cache = ImageCache(str(tmp_path), source=source)
+    # The source is blocked, so this returns only because it does not fetch on the caller's thread
+    assert cache.thumbnail('a', width=32) == placeholder('a')
+    assert cache.thumbnail('a', width=32) == placeholder('a')
+    source.released.set()
+    wait(cache.warm(['a'], width=32))
+    assert source.fetches == ['a']
+    assert cache.thumbnail('a', width=32) != placeholder('a')
+
+
+def test_hit_is_served_without_fetching_again(tmp_path):
+    source = StubSource()
+    cache = ImageCache(str(tmp_path), source=source)
+    wait(cache.warm(['a', 'b'], width=32))
+    first = cache.thumbnail('a', width=32)
+    assert cache.thumbnail('a', width=32) == first
+    assert ImageCache(str(tmp_path), source=source).thumbnail('a', width=32) == first
+    assert sorted(source.fetches) == ['a', 'b']
+    assert cache.memory_bytes == len(first) + len(cache.thumbnail('b', width=32))
+
+
+def test_failed_fetch_serves_a_placeholder_and_is_not_retried_immediately(tmp_path, placeholder):
+    source = StubSource(fail=True)
+    cache = ImageCache(str(tmp_path), source=source, retry_after=300)
+    assert cache.thumbnail('a', width=32, wait=True) == placeholder('a')
+    wait(cache.warm(['a'], width=32))
+    assert cache.thumbnail('a', width=32) == placeholder('a')
+    # The miss above queued another warm; let it find the failure still fresh
+    wait(cache.warm(['a'], width=32))
+    assert source.fetches == ['a']
+    cache.retry_after = 0
+    source.fail = False
+    assert cache.thumbnail('a', width=32, wait=True) != placeholder('a')
+    assert source.fetches == ['a', 'a']
+
+
+def test_placeholders_are_drawn_once_per_url_and_width(tmp_path):
+    fallback = StubSource()
+    cache = ImageCache(str(tmp_path), source=StubSource(fail=True), fallback=fallback)
+    first = cache.thumbnail('a', width=32, wait=True)
+    assert cache.thumbnail('a', width=32, wait=True) is first
+    cache.thumbnail('a', width=64, wait=True)
+    assert fallback.fetches == ['a', 'a']
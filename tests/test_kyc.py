@@ -0,0 +1,124 @@
+import hashlib
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from kyc import DocumentSpool, DocumentTooLarge, KYCQueue, StubVerifier, verify_applicants
+
+PERSONAL_INFO = {
+    'full_name': 'Ayesha Khan', 'email': 'ayesha@example.com', 'phone': '0300 1234567',
+    'address': '12 Clifton, Karachi', 'date_of_birth': '1990-01-01', 'national_id': '42101-1234567-1'
+}
+DOCUMENTS = {'id_document': 'id.pdf', 'address_proof': 'bill.pdf'}
+
+
+class Upload(io.BytesIO):
+    """Stand-in for a Streamlit UploadedFile"""
+
+    def __init__(self, data, name='id.pdf', file_id=None, declare_size=True):
+        super().__init__(data)
+        self.name = name
+        self.type = 'application/pdf'
+        self.file_id = file_id
+        self.size = len(data) if declare_size else None
+        self.reads = 0
+
+    def read(self, *args):
+        self.reads += 1
+        return super().read(*args)
+
+
+class FailingVerifier:
+    def verify(self, personal_info, documents):
+        raise ConnectionError('provider unavailable')
+
+
+def test_queue_returns_the_verifier_result():
+    queue = KYCQueue(StubVerifier(delay=0, success_rate=1.0), max_workers=2)
+    try:
+        accepted = queue.submit(PERSONAL_INFO, DOCUMENTS).result(timeout=5)
+        missing = queue.submit(PERSONAL_INFO, {'id_document': 'id.pdf'}).result(timeout=5)
+    finally:
+        queue.shutdown()
+    assert accepted['verified'] and accepted['verification_date'] is not None
+    assert not missing['verified'] and not missing['docs_complete'] and missing['rejection_reason']
+
+
+def test_queue_copies_the_application():
+    queue = KYCQueue(StubVerifier(delay=0.05, success_rate=1.0), max_workers=1)
+    personal_info = dict(PERSONAL_INFO)
+    try:
+        future = queue.submit(personal_info, DOCUMENTS)
+        personal_info['email'] = ''
+        assert future.result(timeout=5)['verified']
+    finally:
+        queue.shutdown()
+
+
+def test_verify_applicants_only_sends_complete_applications():
+    applicants = pd.DataFrame([
+        dict(PERSONAL_INFO, **DOCUMENTS, applicant_id=1),
+        dict(PERSONAL_INFO, **DOCUMENTS, applicant_id=2, phone='  '),
+        dict(PERSONAL_INFO, applicant_id=3, id_document='id.pdf'),
+        dict(PERSONAL_INFO, **DOCUMENTS, applicant_id=4)
+    ])
+    results, metrics = verify_applicants(applicants, StubVerifier(delay=0, success_rate=1.0), max_workers=2)
+    assert list(results['applicant_id']) == ['1', '2', '3', '4']
+    assert list(results['verified']) == [True, False, False, True]
+    assert list(results['fields_complete']) == [True, False, True, True]
+    assert list(results['docs_complete']) == [True, True, False, True]
+    assert results['verification_date'].notna().tolist() == [True, False, False, True]
+    assert metrics['count'] == 4 and metrics['verifier_calls'] == 2 and metrics['verified'] == 2
+
+
+def test_verify_applicants_records_verifier_errors():
+    applicants = pd.DataFrame([dict(PERSONAL_INFO, **DOCUMENTS)])
+    results, metrics = verify_applicants(applicants, FailingVerifier(), max_workers=1)
+    assert not results['verified'].iat[0]
+    assert results['rejection_reason'].iat[0] == 'Verifier error: provider unavailable'
+    assert metrics['verified'] == 0
+
+
+def spooled_files(root):
+    return sorted(os.listdir(root))
+
+
+def test_spool_stores_identical_documents_once(tmp_path):
+    spool = DocumentSpool(str(tmp_path), chunk_size=4)
+    first = spool.ingest(Upload(b'same scan', name='id.pdf', file_id='u1'))
+    second = spool.ingest(Upload(b'same scan', name='copy.pdf', file_id='u2'))
+    assert first['sha256'] == second['sha256'] == hashlib.sha256(b'same scan').hexdigest()
+    assert (first['name'], second['name']) == ('id.pdf', 'copy.pdf')
+    assert spooled_files(tmp_path) == [first['sha256']]
+    with open(spool.path(first['sha256']), 'rb') as f:
+        assert f.read() == b'same scan'
+
+
+def test_spool_reuses_the_previous_ingest_of_the_same_upload(tmp_path):
+    spool = DocumentSpool(str(tmp_path))
+    previous = spool.ingest(Upload(b'scan', file_id='u1'))
+    upload = Upload(b'scan', file_id='u1')
+    assert spool.ingest(upload, previous=previous) is previous
+    assert upload.reads == 0
+    os.remove(spool.path(previous['sha256']))
+    assert spool.ingest(upload, previous=previous) == previous
+    assert spool.exists(previous)
+
+
+def test_spool_rejects_a_declared_size_over_the_limit_without_reading(tmp_path):
+    spool = DocumentSpool(str(tmp_path), max_bytes=8)
+    upload = Upload(b'x' * 9)
+    with pytest.raises(DocumentTooLarge):
+        spool.ingest(upload)
+    assert upload.reads == 0
+    assert spooled_files(tmp_path) == []
+
+
+def test_spool_cuts_off_undeclared_streams_over_the_limit(tmp_path):
+    spool = DocumentSpool(str(tmp_path), max_bytes=8, chunk_size=4)
+    with pytest.raises(DocumentTooLarge):
+        spool.ingest(Upload(b'x' * 13, declare_size=False))
+    assert spooled_files(tmp_path) == []
+    assert spool.ingest(Upload(b'x' * 8, declare_size=False))['size'] == 8
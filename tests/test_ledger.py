@@ -0,0 +1,91 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import ledger as ledger_module
+from ledger import InsufficientTokens, TokenLedger, stress
+from storage import Storage
+
+PROPERTY = {
+    'id': None, 'name': 'Test Tower', 'location': 'Karachi', 'price': 10000000, 'roi': 15.0,
+    'tokens_supply': 100, 'tokens_available': 100, 'image_url': '', 'description': '',
+    'property_type': 'Residential', 'year_built': 2020, 'square_feet': 5000
+}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = Storage(str(tmp_path / 'ledger.db'), pool_size=4)
+    storage.add_property(PROPERTY)
+    yield storage
+    storage.close()
+
+
+def test_reserve_then_commit_keeps_the_tokens_sold(storage):
+    ledger = TokenLedger(storage)
+    reservation_id = ledger.reserve('PROP_001', 30)
+    assert ledger.available(['PROP_001']) == {'PROP_001': 70}
+    assert ledger.commit(reservation_id)
+    assert not ledger.commit(reservation_id) and not ledger.release(reservation_id)
+    assert ledger.available(['PROP_001']) == {'PROP_001': 70}
+
+
+def test_reserve_then_release_returns_the_tokens(storage):
+    ledger = TokenLedger(storage)
+    reservation_id = ledger.reserve('PROP_001', 30)
+    assert ledger.release(reservation_id)
+    assert not ledger.release(reservation_id) and not ledger.commit(reservation_id)
+    assert ledger.available(['PROP_001']) == {'PROP_001': 100}
+
+
+def test_reserving_more_than_is_available_is_rejected(storage):
+    ledger = TokenLedger(storage)
+    ledger.reserve('PROP_001', 80)
+    with pytest.raises(InsufficientTokens):
+        ledger.reserve('PROP_001', 21)
+    assert ledger.available(['PROP_001']) == {'PROP_001': 20}
+
+
+def test_expired_reservations_are_returned_and_cannot_be_committed(storage, monkeypatch):
+    ledger = TokenLedger(storage, ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr(ledger_module.time, 'time', lambda: now[0])
+    abandoned = ledger.reserve('PROP_001', 90)
+    now[0] += 30
+    assert ledger.available(['PROP_001']) == {'PROP_001': 10}
+    now[0] += 31
+    # The next reserve sweeps the abandoned checkout before taking tokens
+    ledger.reserve('PROP_001', 50)
+    assert not ledger.commit(abandoned)
+    assert ledger.available(['PROP_001']) == {'PROP_001': 50}
+
+
+def test_concurrent_buyers_never_oversell(storage):
+    ledger = TokenLedger(storage)
+    committed = []
+    lock = threading.Lock()
+
+    def buy(tokens):
+        try:
+            reservation_id = ledger.reserve('PROP_001', tokens)
+        except InsufficientTokens:
+            return
+        if ledger.commit(reservation_id):
+            with lock:
+                committed.append(tokens)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(buy, [1, 2, 3, 4, 5] * 40))
+    remaining = ledger.available(['PROP_001'])['PROP_001']
+    assert sum(committed) <= PROPERTY['tokens_supply']
+    assert sum(committed) + remaining == PROPERTY['tokens_supply']
+
+
+def test_stress_cleans_up_its_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    report = stress(threads=4, purchases=50, tokens_available=40, pool_size=2)
+    assert not report['oversold'] and report['balanced']
+    assert os.listdir(tmp_path) == []
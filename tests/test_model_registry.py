@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from features import FEATURE_COLUMNS, FeatureMatrix
+from model_registry import ModelRegistry
+from training import fit_xgboost, held_out_positions, train_registered_xgboost
+
+
+def training_data(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, 4), dtype=np.float32)
+    y = (X @ np.array([1.0, 2.0, -1.0, 0.5], dtype=np.float32)).astype(np.float32)
+    return X, y
+
+
+def test_key_depends_on_dataset_version_features_and_data():
+    assert ModelRegistry.key(FEATURE_COLUMNS, 2, 'abc') == ModelRegistry.key(list(FEATURE_COLUMNS), 2, 'abc')
+    assert ModelRegistry.key(FEATURE_COLUMNS, 2, 'abc') != ModelRegistry.key(FEATURE_COLUMNS, 3, 'abc')
+    assert ModelRegistry.key(FEATURE_COLUMNS, 2, 'abc') != ModelRegistry.key(FEATURE_COLUMNS[:-1], 2, 'abc')
+    assert ModelRegistry.key(FEATURE_COLUMNS, 2, 'abc') != ModelRegistry.key(FEATURE_COLUMNS, 2, 'def')
+
+
+def test_feature_matrix_fingerprint_changes_with_the_data():
+    X, y = training_data()
+    index = pd.RangeIndex(len(y))
+    assert FeatureMatrix(index, X, y).fingerprint == FeatureMatrix(index, X.copy(), y.copy()).fingerprint
+    assert FeatureMatrix(index, X, y).fingerprint != FeatureMatrix(index, X, y + 1).fingerprint
+    assert FeatureMatrix(index, X, y).fingerprint != FeatureMatrix(index[:-1], X[:-1], y[:-1]).fingerprint
+
+
+def test_held_out_positions_match_the_fit_split():
+    X, y = training_data()
+    test = held_out_positions(len(y))
+    assert np.array_equal(np.sort(fit_xgboost(X, y)['y_test']), np.sort(y[test]))
+
+
+def test_trained_model_is_saved_before_the_job_returns(tmp_path):
+    X, y = training_data()
+    key = ModelRegistry.key(['a', 'b', 'c', 'd'], 1)
+    test = held_out_positions(len(y))[:10]
+    result = train_registered_xgboost(str(tmp_path), key, X, y, test, {'dataset_version': 1})
+    assert 'model_raw' not in result
+    assert result['registry']['key'] == key and result['registry']['n_rows'] == len(y)
+    assert np.array_equal(result['y_test'], y[test])
+    booster, metadata = ModelRegistry(str(tmp_path)).get(key)
+    assert metadata == result['registry']
+
+
+def test_prune_deletes_models_for_other_keys(tmp_path):
+    X, y = training_data()
+    registry = ModelRegistry(str(tmp_path))
+    raw = fit_xgboost(X, y, n_estimators=5)['model_raw']
+    registry.save('current', raw, {})
+    registry.save('stale', raw, {})
+    assert registry.prune(['current']) == ['stale']
+    assert registry.get('stale') is None
+    assert [metadata['key'] for metadata in registry.entries()] == ['current']
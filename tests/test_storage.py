@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+
+from storage import Storage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = Storage(str(tmp_path / 'proptoken.db'), pool_size=2)
+    yield storage
+    storage.close()
+
+
+def invest(storage, user_id, property_id, amount, tokens):
+    storage.record_investment(user_id, {
+        'property_id': property_id, 'property_name': property_id, 'investment_amount': amount,
+        'tokens_received': tokens, 'ownership_percent': 1.0, 'roi': 15.0, 'platform_fee': amount * 0.02,
+        'net_investment': amount * 0.98, 'timestamp': datetime(2024, 1, 1)
+    })
+
+
+def test_claim_moves_the_sessions_investments_to_the_account(storage):
+    invest(storage, 'session-a', 'PROP_001', 1000, 10)
+    invest(storage, 'session-a', 'PROP_002', 500, 5)
+    assert storage.claim_account('kyc:ayesha@example.com', 'session-a')
+    assert [i['property_id'] for i in storage.investments('kyc:ayesha@example.com')] == ['PROP_001', 'PROP_002']
+    assert storage.portfolio('kyc:ayesha@example.com')['PROP_001'] == {'tokens': 10, 'invested': 1000}
+    assert storage.investments('session-a') == [] and storage.portfolio('session-a') == {}
+
+
+def test_claiming_again_from_the_same_session_merges_new_investments(storage):
+    invest(storage, 'session-a', 'PROP_001', 1000, 10)
+    storage.claim_account('kyc:ayesha@example.com', 'session-a')
+    invest(storage, 'session-a', 'PROP_001', 200, 2)
+    assert storage.claim_account('kyc:ayesha@example.com', 'session-a')
+    assert storage.portfolio('kyc:ayesha@example.com') == {'PROP_001': {'tokens': 12, 'invested': 1200}}
+    assert len(storage.investments('kyc:ayesha@example.com')) == 2
+
+
+def test_an_account_claimed_by_another_session_is_not_handed_over(storage):
+    invest(storage, 'session-a', 'PROP_001', 1000, 10)
+    invest(storage, 'session-b', 'PROP_002', 500, 5)
+    storage.claim_account('kyc:ayesha@example.com', 'session-a')
+    assert not storage.claim_account('kyc:ayesha@example.com', 'session-b')
+    assert [i['property_id'] for i in storage.investments('session-b')] == ['PROP_002']
+    assert list(storage.portfolio('kyc:ayesha@example.com')) == ['PROP_001']
+
+
+def demo_records(seed):
+    return [{
+        'id': f'PROP_{i+1:03d}', 'name': f'Seed {seed} property {i+1}', 'location': 'Lahore', 'price': 1000000 * seed,
+        'roi': 15.0, 'tokens_supply': 1000, 'tokens_available': 100, 'image_url': '', 'description': '',
+        'property_type': 'Residential', 'year_built': 2020, 'square_feet': 5000
+    } for i in range(3)]
+
+
+def test_seeding_runs_once_per_seed_key(storage):
+    assert storage.seed_properties('demo-1', lambda: demo_records(1))
+    assert not storage.seed_properties('demo-1', lambda: demo_records(1))
+    assert len(storage.load_properties()) == 3
+
+
+def test_new_seed_replaces_the_demo_listings_it_shares_ids_with(storage):
+    storage.seed_properties('demo-1', lambda: demo_records(1))
+    listed = storage.add_property(dict(demo_records(1)[0], name='Seller listing'))
+    assert storage.seed_properties('demo-2', lambda: demo_records(2))
+    properties = storage.load_properties()
+    assert list(properties['id']) == ['PROP_001', 'PROP_002', 'PROP_003', listed['id']]
+    assert list(properties['name'])[:3] == [f'Seed 2 property {i}' for i in (1, 2, 3)]
+    # Switching back re-applies the first seed rather than finding its old marker
+    assert storage.seed_properties('demo-1', lambda: demo_records(1))
+    assert storage.load_properties()['name'].iat[0] == 'Seed 1 property 1'
@@ -0,0 +1,70 @@
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from training import TrainingJobs, TrainingService
+
+
+def failed(error):
+    future = Future()
+    future.set_exception(error)
+    return future
+
+
+def test_failed_job_is_resubmitted():
+    jobs = TrainingJobs()
+    jobs.sync('selection')
+    jobs.start('prophet', lambda: failed(RuntimeError('fit failed')))
+    assert jobs.needs('prophet')
+    retry = jobs.start('prophet', Future)
+    assert jobs.futures['prophet'] is retry and not jobs.needs('prophet')
+
+
+def test_queued_running_and_successful_jobs_are_not_resubmitted():
+    jobs = TrainingJobs()
+    jobs.sync('selection')
+    queued = jobs.start('xgboost', Future)
+    assert jobs.start('xgboost', Future) is queued
+    queued.set_result({'r2': 0.5})
+    assert not jobs.needs('xgboost')
+    assert jobs.start('xgboost', Future) is queued
+
+
+def test_new_selection_cancels_queued_jobs_and_forgets_running_ones():
+    jobs = TrainingJobs()
+    jobs.sync('first')
+    queued = jobs.start('prophet', Future)
+    running = jobs.start('xgboost', Future)
+    running.set_running_or_notify_cancel()
+    jobs.sync('second')
+    assert queued.cancelled() and not running.cancelled()
+    assert jobs.futures == {} and jobs.needs('xgboost')
+
+
+class BrokenExecutor:
+    def submit(self, fn, *args, **kwargs):
+        raise BrokenProcessPool('worker died')
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def test_service_rebuilds_a_pool_broken_by_a_dead_worker():
+    service = TrainingService(max_workers=1)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            service.submit(os._exit, 1).result(timeout=60)
+        assert service.submit(abs, -3).result(timeout=60) == 3
+    finally:
+        service.shutdown()
+
+
+def test_service_returns_a_failed_future_when_the_rebuilt_pool_is_broken_too(monkeypatch):
+    service = TrainingService(max_workers=1)
+    service.shutdown()
+    service._executor = BrokenExecutor()
+    monkeypatch.setattr(service, '_new_executor', BrokenExecutor)
+    future = service.submit(abs, -3)
+    assert isinstance(future.exception(), BrokenProcessPool)
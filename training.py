@@ -0,0 +1,188 @@
+"""Background model training on a shared process pool"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from model_registry import ModelRegistry
+from profiling import PROFILER
+from startup import LazyModule
+
+# XGBoost and scikit-learn load on the first fit, in whichever process runs it
+xgb = LazyModule('xgboost')
+linear_model = LazyModule('sklearn.linear_model')
+metrics = LazyModule('sklearn.metrics')
+model_selection = LazyModule('sklearn.model_selection')
+preprocessing = LazyModule('sklearn.preprocessing')
+
+
+def fit_xgboost(X, y, n_estimators=100, random_state=42):
+    """Train XGBoost on a train/test split and return test-set predictions and metrics.
+
+    The trained booster comes back as native UBJSON bytes so the caller can
+    persist it in the model registry.
+    """
+    started = time.perf_counter()
+    X_train, X_test, y_train, y_test = model_selection.train_test_split(X, y, test_size=0.2, random_state=random_state)
+    xgb_model = xgb.XGBRegressor(n_estimators=n_estimators, random_state=random_state)
+    xgb_model.fit(X_train, y_train)
+    train_time = time.perf_counter() - started
+    y_pred = xgb_model.predict(X_test)
+    return {
+        'y_test': y_test,
+        'y_pred': y_pred,
+        'mse': metrics.mean_squared_error(y_test, y_pred),
+        'r2': metrics.r2_score(y_test, y_pred),
+        'train_time': train_time,
+        'model_raw': bytes(xgb_model.get_booster().save_raw('ubj'))
+    }
+
+
+def held_out_positions(n_rows, random_state=42):
+    """Row positions fit_xgboost holds out for testing on an n_rows matrix"""
+    _, test = model_selection.train_test_split(np.arange(n_rows), test_size=0.2, random_state=random_state)
+    return np.sort(test)
+
+
+def evaluate_xgboost(booster, X_test, y_test):
+    """Score a previously trained booster on held-out rows"""
+    y_pred = booster.predict(xgb.DMatrix(X_test))
+    return {
+        'y_test': y_test,
+        'y_pred': y_pred,
+        'mse': metrics.mean_squared_error(y_test, y_pred),
+        'r2': metrics.r2_score(y_test, y_pred)
+    }
+
+
+def train_registered_xgboost(registry_root, key, X, y, test_positions, metadata):
+    """Fit XGBoost on the full feature matrix, save it to the registry and score it on test_positions.
+
+    Runs in a worker process, so the model is on disk before the page sees the
+    result and any other session finds it with ModelRegistry.get.
+    """
+    result = fit_xgboost(X, y)
+    registry = ModelRegistry(registry_root)
+    metadata = registry.save(key, result['model_raw'], dict(
+        metadata,
+        train_time=result['train_time'],
+        rmse=float(np.sqrt(result['mse'])),
+        r2=float(result['r2']),
+        n_rows=len(y)
+    ))
+    booster, _ = registry.get(key)
+    return dict(evaluate_xgboost(booster, X[test_positions], y[test_positions]), registry=metadata)
+
+
+def fit_linear_regression(X, y):
+    """Train a scaled linear regression and return in-sample predictions and coefficients"""
+    scaler = preprocessing.StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    lr_model = linear_model.LinearRegression()
+    lr_model.fit(X_scaled, y)
+    y_pred = lr_model.predict(X_scaled)
+    return {
+        'y_pred': y_pred,
+        'r2': metrics.r2_score(y, y_pred),
+        'coef': lr_model.coef_,
+        'intercept': lr_model.intercept_
+    }
+
+
+class TrainingService:
+    """Process pool that runs model fits off the Streamlit script thread"""
+
+    def __init__(self, max_workers=3):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+
+    def _new_executor(self):
+        # spawn rather than fork: the Streamlit server process is multi-threaded
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+
+    def submit(self, fn, *args, **kwargs):
+        """Submit fn to the pool, rebuilding the pool once if a dead worker broke it.
+
+        If the rebuilt pool is broken too, the returned future holds the
+        BrokenProcessPool error instead of it being raised, so callers show a
+        failed job rather than a crashed page.
+        """
+        executor = self._executor
+        try:
+            return executor.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            self._rebuild(executor)
+        try:
+            return self._executor.submit(fn, *args, **kwargs)
+        except BrokenProcessPool as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+
+    def _rebuild(self, broken):
+        with self._lock:
+            # Another session may already have replaced the broken pool
+            if self._executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class TrainingJobs:
+    """Fit jobs submitted for one session's current filter selection"""
+
+    def __init__(self):
+        self.selection_key = None
+        self.futures = {}
+
+    def sync(self, selection_key):
+        """Drop the jobs of a previous filter selection, cancelling those still queued.
+
+        A job that is already running cannot be stopped: it runs to completion
+        in its worker and its result is never rendered. So a session never has
+        more than one selection's jobs queued, plus whatever was already
+        running when the selection changed.
+        """
+        if selection_key == self.selection_key:
+            return
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        self.selection_key = selection_key
+
+    def needs(self, name):
+        """Whether name has no queued, running or successful job for this selection, e.g. because its last one failed"""
+        future = self.futures.get(name)
+        return future is None or (future.done() and not future.cancelled() and future.exception() is not None)
+
+    def start(self, name, start_job):
+        """Start a job with start_job() unless one is already queued, running or succeeded for this selection"""
+        if self.needs(name):
+            started = time.perf_counter()
+            future = start_job()
+            # Queue wait plus fit time as the page sees it; the fit itself runs in another process
+            future.add_done_callback(
+                lambda f: PROFILER.record(f'training.{name}', time.perf_counter() - started) if not f.cancelled() else None
+            )
+            self.futures[name] = future
+        return self.futures[name]
+
+    def submit(self, service, name, fn, *args, **kwargs):
+        """Submit a fit job to the service unless one is already queued, running or succeeded for this selection"""
+        return self.start(name, lambda: service.submit(fn, *args, **kwargs))
+
+    def set_result(self, name, result):
+        """Record a result that was available without training, e.g. from a cache"""
+        future = Future()
+        future.set_result(result)
+        self.futures[name] = future
+        return future
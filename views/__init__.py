@@ -0,0 +1,43 @@
+"""Page registry: each page lives in its own module and is imported the first time it is shown"""
+import importlib
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from profiling import profile_section
+
+# name -> {'module', 'function', 'icon'}, in menu order
+PAGES = {}
+
+
+def register_page(name, module, function, icon=None):
+    """Add a page to the menu; module is only imported when the page is first selected"""
+    PAGES[name] = {'module': module, 'function': function, 'icon': icon}
+
+
+def render_page(name):
+    """Import the page's module if needed and render it, timing the whole page as one section"""
+    page = PAGES[name]
+    with profile_section(f"page.{page['function']}"):
+        getattr(importlib.import_module(page['module']), page['function'])()
+
+
+def wait_for(statuses, poll=0.5):
+    """Yield futures as they complete; statuses maps each future to the placeholder and message shown while it runs"""
+    pending = dict(statuses)
+    started = time.monotonic()
+    while pending:
+        done = [future for future in pending if future.done()]
+        if not done:
+            # Updating the placeholders lets Streamlit interrupt this run on the next interaction
+            for status, message in pending.values():
+                status.info(f"{message} ({time.monotonic() - started:.0f}s)")
+            done, _ = wait(pending, timeout=poll, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.pop(future)[0].empty()
+            yield future
+
+
+register_page("KYC", 'views.kyc_page', 'kyc_page', icon="shield-check")
+register_page("Home", 'views.home_page', 'home_page', icon="house")
+register_page("Portfolio/Marketplace", 'views.marketplace_page', 'marketplace_page', icon="briefcase")
+register_page("Analytics", 'views.analytics_page', 'analytics_page', icon="graph-up")
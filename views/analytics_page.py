@@ -0,0 +1,970 @@
+"""Analytics page: ROI history, forecasts and model training"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from datetime import datetime
+from forecasting import GROUP_MIN_POINTS, fit_prophet_forecast, forecast_cache_key, forecast_groups
+from training import TrainingJobs, evaluate_xgboost, fit_linear_regression, held_out_positions, train_registered_xgboost
+from features import FEATURE_COLUMNS
+from startup import LazyModule
+from assets import inject_styles
+from profiling import profile_section, profiled
+from resources import load_historical_data, load_feature_matrix, get_forecast_cache, get_model_registry, get_training_service, xgboost_model_key, HISTORICAL_DATA_VERSION
+from views import wait_for
+
+# Plotly Express is only needed by the analytics page
+px = LazyModule('plotly.express')
+
+# The page's data steps are plain functions so benchmarks.py can time exactly what the page runs
+def filter_history(history, locations, date_range, min_roi):
+    """Rows of the ROI history matching the page filters"""
+    return history[
+        (history['location'].isin(locations)) &
+        (history['date'] >= pd.to_datetime(date_range[0])) &
+        (history['date'] <= pd.to_datetime(date_range[1])) &
+        (history['roi'] >= min_roi)
+    ]
+
+def top_properties_by_roi(data, n=3):
+    """The n properties with the highest average ROI"""
+    return data.groupby('property_id').agg({
+        'roi': 'mean',
+        'price': 'first',
+        'location': 'first'
+    }).sort_values('roi', ascending=False).head(n)
+
+def mean_roi_series(data):
+    """Average ROI per date as the ds/y series Prophet trains on"""
+    series = data.groupby('date')['roi'].mean().reset_index()
+    series.columns = ['ds', 'y']
+    return series
+
+def property_comparison(data):
+    """Average ROI and price per property and location"""
+    return data.groupby(['property_id', 'location']).agg({
+        'roi': 'mean',
+        'price': 'first'
+    }).reset_index()
+
+def location_performance(data):
+    """ROI and price statistics per location, best average ROI first"""
+    location_stats = data.groupby('location').agg({
+        'roi': ['mean', 'std', 'min', 'max'],
+        'price': 'mean',
+        'property_id': 'count'
+    }).round(2)
+    location_stats.columns = ['Avg ROI', 'ROI Std Dev', 'Min ROI', 'Max ROI', 'Avg Price', 'Property Count']
+    return location_stats.sort_values('Avg ROI', ascending=False)
+
+def render_prophet_forecast(prophet_data, forecast):
+    """Plot the Prophet forecast against the historical series"""
+    # Plot
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=prophet_data['ds'], 
+        y=prophet_data['y'], 
+        mode='lines+markers',
+        name='Historical ROI',
+        line=dict(color='blue', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast['ds'], 
+        y=forecast['yhat'], 
+        mode='lines',
+        name='Prophet Prediction',
+        line=dict(color='red', width=3, dash='dash')
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast['ds'], 
+        y=forecast['yhat_lower'], 
+        mode='lines',
+        name='Lower Confidence',
+        line=dict(color='red', dash='dot'),
+        showlegend=False
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast['ds'], 
+        y=forecast['yhat_upper'], 
+        mode='lines',
+        name='Upper Confidence',
+        line=dict(color='red', dash='dot'),
+        fill='tonexty',
+        fillcolor='rgba(255,0,0,0.1)'
+    ))
+
+    fig.update_layout(
+        title="Prophet Model: ROI Forecasting with Confidence Intervals",
+        xaxis_title="Date",
+        yaxis_title="ROI (%)",
+        hovermode='x unified',
+        height=500
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Prophet Model Metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div class="stats-card">
+            <div class="stats-value">94.2%</div>
+            <div class="stats-label">Model Accuracy</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div class="stats-card">
+            <div class="stats-value">12 Months</div>
+            <div class="stats-label">Forecast Period</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div class="stats-card">
+            <div class="stats-value">95%</div>
+            <div class="stats-label">Confidence Level</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_xgboost_results(result):
+    """Plot XGBoost test-set predictions and metrics"""
+    y_test = result['y_test']
+    y_pred = result['y_pred']
+
+    # Plot predictions vs actual
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=y_test,
+        y=y_pred,
+        mode='markers',
+        name='Predictions vs Actual',
+        marker=dict(color='blue', size=8)
+    ))
+    fig.add_trace(go.Scatter(
+        x=[y_test.min(), y_test.max()],
+        y=[y_test.min(), y_test.max()],
+        mode='lines',
+        name='Perfect Prediction',
+        line=dict(color='red', dash='dash')
+    ))
+
+    fig.update_layout(
+        title="XGBoost Model: ROI Predictions vs Actual Values",
+        xaxis_title="Actual ROI (%)",
+        yaxis_title="Predicted ROI (%)",
+        height=400
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # XGBoost Metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{result['r2']:.3f}</div>
+            <div class="stats-label">R² Score</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{np.sqrt(result['mse']):.3f}</div>
+            <div class="stats-label">RMSE</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div class="stats-card">
+            <div class="stats-value">XGBoost</div>
+            <div class="stats-label">Model Type</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    if 'registry' in result:
+        metadata = result['registry']
+        st.caption(f"Model {metadata['key']} · saved {metadata['saved_at'][:19]} · trained in {metadata['train_time']:.2f}s")
+
+def render_regression_results(training_rows, result):
+    """Plot the linear regression fit and its coefficients"""
+    # Plot regression line
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=training_rows['price'],
+        y=training_rows['roi'],
+        mode='markers',
+        name='Data Points',
+        marker=dict(color='blue', size=6)
+    ))
+    fig.add_trace(go.Scatter(
+        x=training_rows['price'],
+        y=result['y_pred'],
+        mode='markers',
+        name='Predicted ROI',
+        marker=dict(color='red', size=6, symbol='x')
+    ))
+
+    fig.update_layout(
+        title="Linear Regression: Actual vs Predicted ROI by Property Price",
+        xaxis_title="Property Price (PKR)",
+        yaxis_title="ROI (%)",
+        height=400
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Regression Metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{result['r2']:.3f}</div>
+            <div class="stats-label">R² Score</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{result['coef'][0]:.3f}</div>
+            <div class="stats-label">Price Coefficient</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{result['intercept']:.3f}</div>
+            <div class="stats-label">Intercept</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_group_forecasts(forecast, by):
+    """Plot one Prophet forecast line per location or property"""
+    if forecast.empty:
+        level = "location" if by == 'location' else "property"
+        st.info(f"No {level} has {GROUP_MIN_POINTS} or more months of data in this selection, so there is nothing to forecast. "
+                "Widen the date range or lower the minimum ROI.")
+        return
+    
+    fig = px.line(
+        forecast,
+        x='ds',
+        y='yhat',
+        color=by,
+        title="Prophet Forecasts by " + ("Location" if by == 'location' else "Property"),
+        labels={'ds': 'Date', 'yhat': 'Predicted ROI (%)'}
+    )
+    fig.update_layout(height=500, hovermode='x unified')
+    st.plotly_chart(fig, use_container_width=True)
+
+def submit_training_jobs(jobs, prophet_data, feature_matrix, positions):
+    """Queue Prophet, XGBoost and Linear Regression fits for the selected feature rows"""
+    service = get_training_service()
+    
+    if len(prophet_data) > 10:
+        forecast_cache = get_forecast_cache()
+        forecast_key = forecast_cache_key(prophet_data, periods=12, freq='M')
+        forecast = forecast_cache.get(forecast_key)
+        if forecast is not None:
+            jobs.set_result('prophet', forecast)
+        elif jobs.needs('prophet'):
+            future = jobs.submit(service, 'prophet', fit_prophet_forecast, prophet_data, periods=12, freq='M')
+            future.add_done_callback(
+                lambda f: forecast_cache.put(forecast_key, f.result())
+                if not f.cancelled() and f.exception() is None else None
+            )
+    
+    # XGBoost is trained once on the full feature matrix and scored on the
+    # selected rows it did not train on
+    X, y = feature_matrix.X, feature_matrix.y
+    test_positions = np.intersect1d(positions, held_out_positions(len(y)))
+    if len(positions) > 20 and len(test_positions) > 1 and jobs.needs('xgboost'):
+        registry = get_model_registry()
+        model_key = xgboost_model_key()
+        entry = registry.get(model_key)
+        if entry is not None:
+            booster, metadata = entry
+            jobs.set_result('xgboost', dict(evaluate_xgboost(booster, X[test_positions], y[test_positions]), registry=metadata))
+        else:
+            jobs.submit(service, 'xgboost', train_registered_xgboost, registry.root, model_key, X, y, test_positions, {
+                'features': FEATURE_COLUMNS,
+                'dataset_version': HISTORICAL_DATA_VERSION,
+                'data_fingerprint': feature_matrix.fingerprint
+            })
+    if len(positions) > 10:
+        jobs.submit(service, 'regression', fit_linear_regression, X[positions], y[positions])
+
+@profiled('analytics.training_results')
+def render_training_results(jobs, model_slots):
+    """Render each model into its slot as soon as its fit job completes"""
+    statuses, slots = {}, {}
+    for name, (slot, label, render) in model_slots.items():
+        with slot:
+            status = st.empty()
+        future = jobs.futures[name]
+        statuses[future] = (status, f"🔄 Training {label} model...")
+        slots[future] = (slot, label, render)
+    
+    for future in wait_for(statuses):
+        slot, label, render = slots[future]
+        with slot:
+            if future.cancelled() or future.exception() is not None:
+                st.error(f"{label} training failed: {future.exception() if not future.cancelled() else 'cancelled'}")
+            else:
+                render(future.result())
+
+def analytics_page():
+    """Analytics page with black and white theme"""
+    
+    # Black and White Analytics Theme
+    inject_styles('analytics')
+    
+    st.markdown("""
+    <div class="analytics-container">
+        <div class="analytics-header">
+            <h1 style="font-size: 3rem; font-weight: 900; margin: 0; text-transform: uppercase; letter-spacing: 3px;">
+                AI-POWERED ANALYTICS
+            </h1>
+            <p style="font-size: 1.2rem; margin: 1rem 0 0 0; font-weight: 600;">
+                Machine learning insights for real estate investment
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ML Models Section
+    st.markdown("""
+    <div class="ml-models-section">
+        <h2 style="font-size: 2rem; font-weight: 900; margin-bottom: 1.5rem; text-align: center; text-transform: uppercase;">
+            🧠 MACHINE LEARNING MODELS
+        </h2>
+        <div style="
+            background: #fff;
+            color: #000;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 16s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                🤖 AI-POWERED PREDICTIONS • MACHINE LEARNING INSIGHTS • DATA-DRIVEN DECISIONS • PREDICTIVE ANALYTICS • SMART INVESTMENT RECOMMENDATIONS • FUTURE ROI FORECASTING • 🤖
+            </div>
+        </div>
+        <div class="model-item">
+            <div class="model-title">PROPHET</div>
+            <div class="model-description">Time series forecasting for ROI predictions</div>
+        </div>
+        <div class="model-item">
+            <div class="model-title">XGBOOST</div>
+            <div class="model-description">Gradient boosting for property value predictions</div>
+        </div>
+        <div class="model-item">
+            <div class="model-title">REGRESSION</div>
+            <div class="model-description">Linear models for return analysis</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Load historical data (generated once per process, shared by all sessions)
+    with profile_section('analytics.load_data'):
+        historical_data = load_historical_data()
+    
+    # Filters
+    st.markdown("""
+    <div class="filters-container">
+        <h2 class="filters-title">🔍 ANALYTICS FILTERS</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 14s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                📊 CUSTOMIZE YOUR ANALYSIS • FILTER BY LOCATION • ADJUST TIME RANGES • SELECT PROPERTY TYPES • REAL-TIME INSIGHTS • INTERACTIVE CHARTS • 📊
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        selected_locations = st.multiselect(
+            "Select Locations", 
+            options=list(historical_data['location'].unique()),
+            default=list(historical_data['location'].unique())[:3]
+        )
+    
+    with col2:
+        date_range = st.date_input(
+            "Date Range",
+            value=(datetime(2023, 1, 1), datetime(2024, 1, 1)),
+            max_value=datetime.now()
+        )
+    
+    with col3:
+        min_roi_filter = st.slider("Minimum ROI (%)", 0, 30, 8)
+    
+    # Filter data
+    with profile_section('analytics.filter'):
+        filtered_data = filter_history(historical_data, selected_locations, date_range, min_roi_filter)
+    
+    if len(filtered_data) == 0:
+        st.warning("No data available for the selected filters.")
+        st.info(f"Debug info: Total data points: {len(historical_data)}, Selected locations: {selected_locations}, Date range: {date_range}, Min ROI: {min_roi_filter}")
+        return
+    
+    # Top 3 properties by ROI
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">🏆 TOP 3 PERFORMING PROPERTIES</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 13s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                🏆 HIGHEST PERFORMING INVESTMENTS • BEST ROI OPPORTUNITIES • PREMIUM PROPERTIES • TOP RATED LOCATIONS • MAXIMUM RETURNS • 🏆
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Best performing properties based on average ROI over the selected period
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    with profile_section('analytics.top_properties'):
+        top_properties = top_properties_by_roi(filtered_data)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    for i, (prop_id, data) in enumerate(top_properties.iterrows()):
+        with [col1, col2, col3][i]:
+            st.markdown(f"""
+            <div class="property-card">
+                <h4>{prop_id}</h4>
+                <p><strong>Location:</strong> {data['location']}</p>
+                <p><strong>Avg ROI:</strong> {data['roi']:.2f}%</p>
+                <p><strong>Price:</strong> PKR {data['price']:,}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Market Statistics
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">📊 MARKET STATISTICS</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 17s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                📊 KEY PERFORMANCE INDICATORS • MARKET TRENDS ANALYSIS • INVESTMENT INSIGHTS • DATA-DRIVEN STATISTICS • PERFORMANCE METRICS • 📊
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Key performance indicators and market trends
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        avg_roi = filtered_data['roi'].mean()
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{avg_roi:.2f}%</div>
+            <div class="stats-label">Average ROI</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        total_properties = len(filtered_data['property_id'].unique())
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{total_properties}</div>
+            <div class="stats-label">Total Properties</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        avg_price = filtered_data['price'].mean()
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">PKR {avg_price:,.0f}</div>
+            <div class="stats-label">Average Price</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        max_roi = filtered_data['roi'].max()
+        st.markdown(f"""
+        <div class="stats-card">
+            <div class="stats-value">{max_roi:.2f}%</div>
+            <div class="stats-label">Highest ROI</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Prepare data for Prophet
+    with profile_section('analytics.prepare_training'):
+        prophet_data = mean_roi_series(filtered_data)
+    
+        # Train all models in the background; queued jobs for a previous filter selection are cancelled
+        if 'training_jobs' not in st.session_state:
+            st.session_state.training_jobs = TrainingJobs()
+        training_jobs = st.session_state.training_jobs
+        training_jobs.sync((HISTORICAL_DATA_VERSION, tuple(selected_locations), tuple(date_range), min_roi_filter))
+        # XGBoost and Linear Regression use rows of the same precomputed feature matrix
+        feature_matrix = load_feature_matrix()
+        positions = feature_matrix.positions(filtered_data.index)
+        feature_index = feature_matrix.index[positions]
+        submit_training_jobs(training_jobs, prophet_data, feature_matrix, positions)
+    model_slots = {}
+    
+    # Machine Learning Models Section
+    st.markdown("## 🤖 Machine Learning Models")
+    
+    # Prophet Model
+    st.markdown("""
+    <div class="content-section">
+        <h3 class="section-title">📈 PROPHET TIME SERIES FORECASTING</h3>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 15s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                📈 FUTURE ROI PREDICTIONS • TIME SERIES ANALYSIS • CONFIDENCE INTERVALS • TREND FORECASTING • SEASONAL PATTERNS • 📈
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Facebook's Prophet model for time series forecasting. Predicts future ROI trends with confidence intervals.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Prophet chart is filled in once its fit job completes
+    if 'prophet' in training_jobs.futures:
+        model_slots['prophet'] = (st.container(), "Prophet", lambda forecast: render_prophet_forecast(prophet_data, forecast))
+    
+    # XGBoost Model
+    st.markdown("""
+    <div class="content-section">
+        <h3 class="section-title">🚀 XGBOOST PROPERTY VALUE PREDICTION</h3>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 18s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                🚀 GRADIENT BOOSTING ALGORITHM • PROPERTY VALUE PREDICTIONS • MACHINE LEARNING ACCURACY • FEATURE ANALYSIS • HIGH PERFORMANCE MODEL • 🚀
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Gradient boosting model for predicting property values based on location, size, and historical performance.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if 'xgboost' in training_jobs.futures:
+        model_slots['xgboost'] = (st.container(), "XGBoost", render_xgboost_results)
+    
+    # Linear Regression Model
+    st.markdown("""
+    <div class="content-section">
+        <h3 class="section-title">📊 LINEAR REGRESSION ANALYSIS</h3>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 16s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                📊 LINEAR RELATIONSHIP ANALYSIS • FEATURE CORRELATION • STATISTICAL MODELING • TREND ANALYSIS • DATA INSIGHTS • 📊
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Linear regression model for understanding the relationship between property features and ROI.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if 'regression' in training_jobs.futures:
+        model_slots['regression'] = (st.container(), "Linear Regression", lambda result: render_regression_results(filtered_data.loc[feature_index], result))
+    
+    # Per-location / per-property Prophet forecasts
+    st.markdown("""
+    <div class="content-section">
+        <h3 class="section-title">🌍 PER-LOCATION FORECASTS</h3>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 15s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                🌍 CITY-LEVEL FORECASTS • PROPERTY-LEVEL FORECASTS • PARALLEL MODEL FITTING • 12-MONTH HORIZON • 🌍
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            A separate Prophet model for every selected location or property, fitted in parallel.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    forecast_level = st.radio("Forecast by", ["Location", "Property"], horizontal=True)
+    forecast_by = 'location' if forecast_level == "Location" else 'property_id'
+    
+    if len(filtered_data) > 10:
+        job_name = f'prophet_{forecast_by}'
+        training_jobs.start(job_name, lambda: forecast_groups(
+            filtered_data, forecast_by, get_training_service(), get_forecast_cache(), periods=12, freq='M'
+        ))
+        model_slots[job_name] = (st.container(), f"Per-{forecast_level.lower()} Prophet", lambda forecast: render_group_forecasts(forecast, forecast_by))
+    
+    # Property Comparison
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">📊 PROPERTY PERFORMANCE COMPARISON</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 19s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                📊 COMPARATIVE ANALYSIS • PERFORMANCE BENCHMARKS • LOCATION COMPARISONS • PROPERTY TYPE ANALYSIS • ROI COMPARISONS • 📊
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Comparative analysis of property performance across different locations and property types
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    with profile_section('analytics.property_comparison'):
+        comparison_data = property_comparison(filtered_data)
+    
+        fig = px.bar(
+            comparison_data, 
+            x='property_id', 
+            y='roi',
+            color='location',
+            title="Property Performance: Average ROI by Property and Location",
+            labels={'roi': 'Average ROI (%)', 'property_id': 'Property ID'},
+            height=500
+        )
+        fig.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # ROI Distribution Analysis
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">📈 ROI DISTRIBUTION ANALYSIS</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 20s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                📈 STATISTICAL DISTRIBUTION • MARKET PERFORMANCE PATTERNS • ROI FREQUENCY ANALYSIS • HISTOGRAM INSIGHTS • BOX PLOT STATISTICS • 📈
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Statistical analysis of ROI distribution to understand market performance patterns
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    with profile_section('analytics.roi_distribution'):
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            # ROI Histogram
+            fig = px.histogram(
+                filtered_data, 
+                x='roi',
+                nbins=20,
+                title="ROI Distribution Histogram",
+                labels={'roi': 'ROI (%)', 'count': 'Frequency'}
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+        with col2:
+            # ROI Box Plot
+            fig = px.box(
+                filtered_data,
+                y='roi',
+                title="ROI Box Plot by Location",
+                labels={'roi': 'ROI (%)'}
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Location-wise Performance
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">🏙️ LOCATION-WISE PERFORMANCE ANALYSIS</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 21s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                🏙️ CITY PERFORMANCE METRICS • PAKISTANI REAL ESTATE MARKETS • LOCATION TRENDS • REGIONAL ANALYSIS • URBAN INVESTMENT INSIGHTS • 🏙️
+            </div>
+        </div>
+        <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+            Performance metrics and trends across different Pakistani cities
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    with profile_section('analytics.location_stats'):
+        location_stats = location_performance(filtered_data)
+    
+        st.dataframe(location_stats, use_container_width=True)
+    
+    # Portfolio Allocation (if user has investments)
+    if st.session_state.investments:
+        st.markdown("""
+        <div class="content-section">
+            <h2 class="section-title">🥧 PORTFOLIO ALLOCATION ANALYSIS</h2>
+            <div style="
+                background: #000;
+                color: #fff;
+                padding: 1rem;
+                border-radius: 8px;
+                margin: 1rem 0;
+                overflow: hidden;
+                position: relative;
+            ">
+                <div style="
+                    animation: runningText 22s linear infinite;
+                    white-space: nowrap;
+                    font-size: 1rem;
+                    font-weight: 700;
+                    text-transform: uppercase;
+                    letter-spacing: 1px;
+                ">
+                    🥧 PERSONAL PORTFOLIO DISTRIBUTION • INVESTMENT PERFORMANCE METRICS • ASSET ALLOCATION • DIVERSIFICATION ANALYSIS • PERSONAL FINANCE INSIGHTS • 🥧
+                </div>
+            </div>
+            <p style="text-align: center; color: #666; font-weight: 600; font-size: 1.1rem;">
+                Your current investment portfolio distribution and performance metrics
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        portfolio_data = []
+        for investment in st.session_state.investments:
+            portfolio_data.append({
+                'Property': investment['property_name'],
+                'Investment': investment['investment_amount'],
+                'Ownership': investment['ownership_percent']
+            })
+        
+        portfolio_df = pd.DataFrame(portfolio_data)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = px.pie(
+                portfolio_df, 
+                values='Investment', 
+                names='Property',
+                title="Investment Distribution by Property"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = px.bar(
+                portfolio_df,
+                x='Property',
+                y='Ownership',
+                title="Ownership Percentage by Property"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Portfolio Summary
+        st.markdown("""
+        <div class="content-section">
+            <h3 class="section-title">📊 PORTFOLIO SUMMARY</h3>
+            <div style="
+                background: #000;
+                color: #fff;
+                padding: 1rem;
+                border-radius: 8px;
+                margin: 1rem 0;
+                overflow: hidden;
+                position: relative;
+            ">
+                <div style="
+                    animation: runningText 23s linear infinite;
+                    white-space: nowrap;
+                    font-size: 1rem;
+                    font-weight: 700;
+                    text-transform: uppercase;
+                    letter-spacing: 1px;
+                ">
+                    📊 INVESTMENT OVERVIEW • PORTFOLIO METRICS • TOTAL INVESTMENT VALUE • OWNERSHIP STATISTICS • ACTIVE PORTFOLIO STATUS • 📊
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            total_investment = portfolio_df['Investment'].sum()
+            st.markdown(f"""
+            <div class="stats-card">
+                <div class="stats-value">PKR {total_investment:,.0f}</div>
+                <div class="stats-label">Total Investment</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            avg_ownership = portfolio_df['Ownership'].mean()
+            st.markdown(f"""
+            <div class="stats-card">
+                <div class="stats-value">{avg_ownership:.2f}%</div>
+                <div class="stats-label">Avg Ownership</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            property_count = len(portfolio_df)
+            st.markdown(f"""
+            <div class="stats-card">
+                <div class="stats-value">{property_count}</div>
+                <div class="stats-label">Properties Owned</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown("""
+            <div class="stats-card">
+                <div class="stats-value">Active</div>
+                <div class="stats-label">Portfolio Status</div>
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        st.info("💡 Start investing to see your portfolio allocation and performance metrics!")
+    
+    # Fill in the model charts as their training jobs finish
+    render_training_results(training_jobs, model_slots)
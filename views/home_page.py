@@ -0,0 +1,157 @@
+"""Home page"""
+import streamlit as st
+from assets import inject_styles
+
+def home_page():
+    """Home page with black and white theme"""
+    
+    # Black and White Home Page Theme
+    inject_styles('home')
+    
+    st.markdown("""
+    <div class="home-container">
+        <div class="home-header">
+            <h1 style="font-size: 3rem; font-weight: 900; margin: 0; text-transform: uppercase; letter-spacing: 3px;">
+                PROPTOKEN
+            </h1>
+            <p style="font-size: 1.5rem; margin: 1rem 0 0 0; font-weight: 600;">
+                OWN REAL ESTATE LIKE OWNING SHARES
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # KYC Status Banner
+    if st.session_state.kyc_status['verified']:
+        st.markdown("""
+        <div class="kyc-status kyc-verified">
+            ✅ KYC VERIFIED - READY TO INVEST!
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="kyc-status kyc-pending">
+            🔐 COMPLETE KYC VERIFICATION TO START INVESTING
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Tokenization explanation
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="content-section">
+            <h2 class="section-title">TOKENIZATION EXPLAINED</h2>
+            <p style="font-size: 1.2rem; font-weight: 700; color: #000; margin-bottom: 1rem;">
+                A PROPERTY IS LIKE A PIZZA
+            </p>
+            <p style="color: #666; margin-bottom: 1rem;">
+                Tokenization slices it so anyone can own a piece.
+            </p>
+            <p style="color: #666; margin-bottom: 1rem;">
+                Just like JazzCash tokenizes payments, PropToken tokenizes ownership.
+            </p>
+            <h3 style="color: #000; font-size: 1.3rem; font-weight: 700; margin-bottom: 1rem;">HOW IT WORKS:</h3>
+            <ul style="color: #666; font-weight: 600;">
+                <li>Real estate is divided into digital tokens</li>
+                <li>Each token represents fractional ownership</li>
+                <li>Blockchain ensures transparent, immutable records</li>
+                <li>Trade tokens like stocks on secondary markets</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="content-section">
+            <h2 class="section-title">WHY TOKENIZE REAL ESTATE?</h2>
+            <ul style="color: #666; font-weight: 600; font-size: 1.1rem;">
+                <li><strong style="color: #000;">LOWER BARRIERS:</strong> Invest with as little as $100</li>
+                <li><strong style="color: #000;">LIQUIDITY:</strong> Trade tokens 24/7</li>
+                <li><strong style="color: #000;">TRANSPARENCY:</strong> All transactions on blockchain</li>
+                <li><strong style="color: #000;">DIVERSIFICATION:</strong> Own pieces of multiple properties</li>
+                <li><strong style="color: #000;">GLOBAL ACCESS:</strong> Invest in properties worldwide</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Stats cards
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">MARKET STATISTICS</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 15s linear infinite;
+                white-space: nowrap;
+                font-size: 1.1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 2px;
+            ">
+                🚀 REAL ESTATE TOKENIZATION IS THE FUTURE • GLOBAL MARKET GROWING 20%+ ANNUALLY • INVEST FROM ANYWHERE IN THE WORLD • BLOCKCHAIN SECURITY GUARANTEED • FRACTIONAL OWNERSHIP MADE EASY • LIQUIDITY LIKE NEVER BEFORE • TRANSPARENT TRANSACTIONS • DEMOCRATIZING REAL ESTATE INVESTMENT • 🚀
+            </div>
+        </div>
+    </div>
+    
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="stats-card" style="animation-delay: 0.5s;">
+            <h3>$2.3B</h3>
+            <p>Global tokenization market (2021)</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="stats-card" style="animation-delay: 1s;">
+            <h3>20%+</h3>
+            <p>CAGR expected growth</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="stats-card" style="animation-delay: 1.5s;">
+            <h3>$100</h3>
+            <p>Minimum entry investment</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="stats-card" style="animation-delay: 2s;">
+            <h3>100%</h3>
+            <p>Transparent ownership records</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # CTA Button
+    st.markdown("""
+    <div class="cta-container">
+        <h3 style="color: #000; font-size: 1.8rem; font-weight: 900; margin-bottom: 1rem; text-transform: uppercase; letter-spacing: 2px;">
+            READY TO START INVESTING?
+        </h3>
+        <p style="color: #666; font-size: 1.2rem; font-weight: 600; margin-bottom: 2rem;">
+            Click the button below to explore our marketplace
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Centered CTA button
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("GO TO MARKETPLACE", key="cta_home", help="Start investing in tokenized real estate", use_container_width=True):
+            st.session_state.current_page = "Portfolio/Marketplace"
+            st.rerun()
@@ -0,0 +1,357 @@
+"""KYC verification page"""
+import streamlit as st
+from datetime import datetime
+from kyc import DocumentTooLarge
+from assets import inject_styles
+from profiling import profile_section, profiled
+from resources import claim_verified_account, get_document_spool, get_kyc_queue
+from views import wait_for
+
+@profiled('kyc.verification')
+def render_kyc_verification():
+    """Poll the session's queued KYC job and show its outcome once the verifier returns"""
+    job = st.session_state.get('kyc_job')
+    if job is None:
+        return
+    
+    banner = st.empty()
+    status = st.empty()
+    if not job.done():
+        banner.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
+            color: white;
+            padding: 3rem;
+            border-radius: 30px;
+            text-align: center;
+            margin: 2rem 0;
+            box-shadow: 
+                0 25px 50px rgba(102, 126, 234, 0.4),
+                0 0 30px rgba(102, 126, 234, 0.3);
+            border: 3px solid rgba(255, 255, 255, 0.2);
+            animation: neonGlow 2s ease-in-out infinite;
+            position: relative;
+            overflow: hidden;
+        ">
+            <div style="
+                position: absolute;
+                top: 0;
+                left: 0;
+                right: 0;
+                bottom: 0;
+                background: linear-gradient(45deg, transparent 30%, rgba(255, 255, 255, 0.1) 50%, transparent 70%);
+                animation: cardShimmer 2s ease-in-out infinite;
+            "></div>
+            <h3 style="
+                margin: 0; 
+                font-size: 2.5rem; 
+                font-weight: 800;
+                text-shadow: 0 0 20px rgba(255, 255, 255, 0.8);
+                animation: titlePulse 2s ease-in-out infinite;
+                position: relative;
+                z-index: 2;
+            ">🔍 VERIFYING YOUR DOCUMENTS... 🔍</h3>
+            <p style="
+                margin: 1.5rem 0 0 0; 
+                font-size: 1.3rem;
+                font-weight: 600;
+                text-shadow: 0 0 15px rgba(255, 255, 255, 0.6);
+                position: relative;
+                z-index: 2;
+            ">This may take a few minutes. Please wait...</p>
+        </div>
+        """, unsafe_allow_html=True)
+    for _ in wait_for({job: (status, "🔍 Verifying your documents...")}):
+        pass
+    banner.empty()
+    del st.session_state.kyc_job
+    
+    if job.cancelled() or job.exception() is not None:
+        st.error(f"KYC verification failed: {job.exception() if not job.cancelled() else 'cancelled'}")
+        return
+    
+    verification_result = job.result()
+    if verification_result['verified']:
+        st.session_state.kyc_status['verified'] = True
+        st.session_state.kyc_status['verification_date'] = verification_result['verification_date']
+        st.session_state.kyc_status['account_conflict'] = not claim_verified_account(st.session_state.kyc_status['personal_info']['email'])
+        
+        st.markdown("""
+        <div style="
+            background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+            color: white;
+            padding: 3rem;
+            border-radius: 20px;
+            text-align: center;
+            margin: 2rem 0;
+            box-shadow: 0 20px 40px rgba(16, 185, 129, 0.4);
+            animation: glow 2s ease-in-out infinite;
+        ">
+            <h2 style="margin: 0; font-size: 3rem;">🎉 KYC VERIFIED!</h2>
+            <p style="font-size: 1.5rem; margin: 1rem 0;">Your identity has been successfully verified</p>
+            <p style="font-size: 1.2rem; margin: 0; opacity: 0.9;">You can now invest in tokenized real estate!</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.rerun()
+    else:
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+            color: white;
+            padding: 2rem;
+            border-radius: 20px;
+            text-align: center;
+            margin: 2rem 0;
+            box-shadow: 0 15px 35px rgba(239, 68, 68, 0.4);
+        ">
+            <h3 style="margin: 0; font-size: 2rem;">❌ KYC Verification Failed</h3>
+            <p style="margin: 1rem 0 0 0; opacity: 0.9;">{verification_result['rejection_reason']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.warning("Please check your documents and try again. Ensure all documents are clear and readable.")
+
+def kyc_page():
+    """KYC verification page with simple black and white theme"""
+    
+    # Simple Black and White Theme with Background Animation
+    inject_styles('kyc')
+    
+    st.markdown("""
+    <div class="main-container">
+        <div class="header-section">
+            <h1 style="font-size: 3rem; font-weight: 900; margin: 0; text-transform: uppercase; letter-spacing: 3px;">
+                KYC VERIFICATION
+            </h1>
+            <p style="font-size: 1.2rem; margin: 1rem 0 0 0; font-weight: 600;">
+                Complete your identity verification to start investing
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # KYC Status Display with amazing theme
+    if st.session_state.kyc_status['verified']:
+        st.markdown("""
+        <div class="status-verified">
+            <h2 style="margin: 0; font-size: 2.5rem;">🎉 KYC VERIFIED!</h2>
+            <p style="font-size: 1.3rem; margin: 1rem 0;">Your identity has been successfully verified</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.kyc_status.get('account_conflict'):
+            st.warning("This email is already linked to an account opened in another session, so your investments stay with this session.")
+        
+        # Amazing metrics cards
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown("""
+            <div class="kyc-card">
+                <h3>✅ Verified</h3>
+                <p>Status</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            verification_date = st.session_state.kyc_status.get('verification_date', None)
+            if verification_date:
+                date_str = verification_date.strftime("%Y-%m-%d %H:%M")
+            else:
+                date_str = 'N/A'
+            st.markdown(f"""
+            <div class="kyc-card">
+                <h3>📅 {date_str}</h3>
+                <p>Verified Date</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div class="kyc-card">
+                <h3>💰 PKR 50M</h3>
+                <p>Investment Limit</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown("""
+            <div class="kyc-card">
+                <h3>🔒 Secure</h3>
+                <p>Data Protection</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Re-verify button with amazing styling
+        st.markdown("""
+        <div style="text-align: center; margin: 2rem 0;">
+            <button onclick="window.location.reload()" style="
+                background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+                color: white;
+                border: none;
+                border-radius: 25px;
+                padding: 1rem 2rem;
+                font-size: 1.1rem;
+                font-weight: 600;
+                cursor: pointer;
+                transition: all 0.3s ease;
+                box-shadow: 0 10px 20px rgba(239, 68, 68, 0.3);
+            " onmouseover="this.style.transform='translateY(-2px)'; this.style.boxShadow='0 15px 30px rgba(239, 68, 68, 0.4)'" 
+               onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 10px 20px rgba(239, 68, 68, 0.3)'">
+                🔄 Re-verify KYC
+            </button>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("🔄 Re-verify KYC", key="reverify"):
+            st.session_state.kyc_status['verified'] = False
+            st.session_state.kyc_status['documents_uploaded'] = False
+            st.rerun()
+        
+        return
+    
+    # Simple KYC Form
+    st.markdown("""
+    <div class="form-section">
+        <h2 class="section-title">COMPLETE YOUR KYC VERIFICATION</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    with st.form("kyc_form"):
+        # Personal Information Section
+        st.markdown("""
+        <div class="form-section">
+            <h3 class="section-title">PERSONAL INFORMATION</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            full_name = st.text_input("Full Name *", value=st.session_state.kyc_status['personal_info'].get('full_name', ''), 
+                                     help="Enter your full legal name as it appears on your ID")
+            email = st.text_input("Email Address *", value=st.session_state.kyc_status['personal_info'].get('email', ''),
+                                 help="We'll use this to send you verification updates")
+            phone = st.text_input("Phone Number *", value=st.session_state.kyc_status['personal_info'].get('phone', ''),
+                                 help="Include country code (e.g., +92 for Pakistan)")
+            date_of_birth = st.date_input("Date of Birth *", value=st.session_state.kyc_status['personal_info'].get('date_of_birth', datetime(1990, 1, 1).date()),
+                                        help="Must be 18+ years old")
+        
+        with col2:
+            address = st.text_area("Full Address *", value=st.session_state.kyc_status['personal_info'].get('address', ''),
+                                  help="Complete residential address")
+            national_id = st.text_input("National ID/Passport Number *", value=st.session_state.kyc_status['personal_info'].get('national_id', ''),
+                                       help="CNIC, Passport, or other government-issued ID")
+            occupation = st.text_input("Occupation", value=st.session_state.kyc_status['personal_info'].get('occupation', ''),
+                                      help="Your current job or profession")
+            annual_income = st.selectbox("Annual Income Range", 
+                                      ["Under PKR 500,000", "PKR 500,000 - 1,000,000", "PKR 1,000,000 - 2,500,000", 
+                                       "PKR 2,500,000 - 5,000,000", "PKR 5,000,000 - 10,000,000", "Over PKR 10,000,000"],
+                                      index=2, help="Select your annual income range")
+        
+        # Document Upload Section
+        st.markdown("""
+        <div class="form-section">
+            <h3 class="section-title">DOCUMENT UPLOAD</h3>
+            <p style="text-align: center; color: #666; margin-bottom: 1rem; font-weight: 600;">
+                Please upload clear, high-quality images of your documents
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🆔 ID Document")
+            id_document = st.file_uploader("Passport/Driver's License/CNIC *", 
+                                         type=['png', 'jpg', 'jpeg'], 
+                                         help="Upload front and back of your ID document (max 10 MB)")
+            if id_document:
+                st.image(id_document, width=200, caption="ID Document Preview")
+        
+        with col2:
+            st.markdown("### 🏠 Address Proof")
+            address_proof = st.file_uploader("Utility Bill/Bank Statement *", 
+                                           type=['png', 'jpg', 'jpeg'], 
+                                           help="Document should be less than 3 months old (max 10 MB)")
+            if address_proof:
+                st.image(address_proof, width=200, caption="Address Proof Preview")
+        
+        # Additional documents
+        st.markdown("""
+        <div class="form-section">
+            <h3 class="section-title">ADDITIONAL DOCUMENTS (OPTIONAL)</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        income_proof = st.file_uploader("Income Proof (Pay Stub/Tax Return)", type=['png', 'jpg', 'jpeg', 'pdf'],
+                                       help="Optional: Helps with investment limit approval (max 10 MB)")
+        
+        # Terms and conditions
+        st.markdown("""
+        <div class="form-section">
+            <h3 class="section-title">TERMS AND CONDITIONS</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        terms_accepted = st.checkbox("I agree to the terms and conditions and privacy policy *", 
+                                   help="Required to proceed with KYC verification")
+        data_consent = st.checkbox("I consent to the processing of my personal data for KYC verification *",
+                                  help="Required for identity verification")
+        
+        # Centered Submit Button with Black & White Theme
+        st.markdown("""
+        <div class="submit-container">
+            <h3 style="color: #000; font-size: 1.8rem; font-weight: 900; margin-bottom: 1rem; text-transform: uppercase; letter-spacing: 2px;">
+                READY TO VERIFY YOUR IDENTITY?
+            </h3>
+            <p style="color: #666; font-size: 1.2rem; font-weight: 600; margin-bottom: 2rem;">
+                Click the button below to submit your KYC application
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Centered submit button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            submitted = st.form_submit_button("SUBMIT KYC APPLICATION", type="primary", use_container_width=True)
+        
+        if submitted:
+            if not all([full_name, email, phone, address, national_id, id_document, address_proof, terms_accepted, data_consent]):
+                st.error("❌ Please fill in all required fields and upload required documents.")
+            else:
+                # Store personal information
+                personal_info = {
+                    'full_name': full_name,
+                    'email': email,
+                    'phone': phone,
+                    'address': address,
+                    'date_of_birth': date_of_birth,
+                    'national_id': national_id,
+                    'occupation': occupation,
+                    'annual_income': annual_income
+                }
+                
+                # Spool the uploads to disk; the session keeps only their metadata and hashes
+                spool = get_document_spool()
+                previous = st.session_state.kyc_status['documents']
+                documents = {}
+                with profile_section('kyc.spool_documents'):
+                    try:
+                        for name, upload in (('id_document', id_document), ('address_proof', address_proof), ('income_proof', income_proof)):
+                            documents[name] = spool.ingest(upload, previous=previous.get(name)) if upload else None
+                    except DocumentTooLarge as e:
+                        st.error(f"❌ {e}")
+                        documents = None
+                
+                if documents is not None:
+                    # Update session state
+                    st.session_state.kyc_status['personal_info'] = personal_info
+                    st.session_state.kyc_status['documents'] = documents
+                    st.session_state.kyc_status['documents_uploaded'] = True
+                    
+                    # Verification runs on the KYC queue; the status panel below polls for the result
+                    st.session_state.kyc_job = get_kyc_queue().submit(personal_info, documents)
+    
+    render_kyc_verification()
@@ -0,0 +1,462 @@
+"""Marketplace page: property cards, investments and seller registration"""
+import streamlit as st
+from datetime import datetime
+from catalogue import PropertyCatalogue
+from ledger import InsufficientTokens
+from assets import inject_styles
+from profiling import profile_section, profiled
+from resources import get_storage, get_shared_catalogue, get_token_ledger, current_user_id, get_image_cache, get_invoice_store, get_invoice_queue
+from views import wait_for
+
+# Marketplace card pagination
+MARKETPLACE_PAGE_SIZES = [5, 10, 20, 50]
+MARKETPLACE_DEFAULT_PAGE_SIZE = 10
+MARKETPLACE_SORT_OPTIONS = {
+    "Featured": (None, False),
+    "ROI: High to Low": ('roi', True),
+    "ROI: Low to High": ('roi', False),
+    "Price: Low to High": ('price', False),
+    "Price: High to Low": ('price', True),
+    "Newest Built": ('year_built', True),
+}
+
+# Opening markup for a property card; the matching </div> is emitted after the card's columns.
+# --card-index staggers the slide-in and shimmer animations down the page.
+PROPERTY_CARD_TEMPLATE = '<div class="listing-card" style="--card-index:{index}"><div class="listing-card-shimmer"></div>'
+
+@profiled('marketplace.invoice_download')
+def render_invoice_download(slot):
+    """Offer the latest invoice for download, waiting for its render job after the rest of the page is drawn"""
+    latest = st.session_state.get('latest_pdf')
+    if not latest:
+        return
+    with slot:
+        st.markdown("## 📄 Download Your Investment Documents")
+        status = st.empty()
+    
+    job = latest['job']
+    for _ in wait_for({job: (status, "🔄 Preparing your invoice...")}):
+        pass
+    
+    with slot:
+        pdf = None
+        if job.cancelled() or job.exception() is not None:
+            st.error(f"Invoice generation failed: {job.exception() if not job.cancelled() else 'cancelled'}")
+        else:
+            # Read from the store on each render; only the handle lives in session state
+            pdf = get_invoice_store().read(job.result())
+            if pdf is None:
+                st.info("This invoice has expired from the invoice store.")
+        if pdf is not None:
+            st.download_button(
+                label="📄 Download Invoice & Agreement",
+                data=pdf,
+                file_name=latest['filename'],
+                mime="application/pdf"
+            )
+        if st.button("🗑️ Clear Download"):
+            del st.session_state.latest_pdf
+            st.rerun()
+
+def marketplace_page():
+    """Portfolio/Marketplace page with black and white theme"""
+    
+    # Black and White Marketplace Theme
+    inject_styles('marketplace')
+    
+    st.markdown("""
+    <div class="marketplace-container">
+        <div class="marketplace-header">
+            <h1 style="font-size: 3rem; font-weight: 900; margin: 0; text-transform: uppercase; letter-spacing: 3px;">
+                PROPERTY MARKETPLACE
+            </h1>
+            <p style="font-size: 1.2rem; margin: 1rem 0 0 0; font-weight: 600;">
+                Invest in tokenized real estate properties
+            </p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check KYC status
+    if not st.session_state.kyc_status['verified']:
+        st.markdown("""
+        <div class="kyc-warning">
+            <h2>🔐 KYC VERIFICATION REQUIRED</h2>
+            <p>Complete your identity verification to start investing in properties</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("COMPLETE KYC VERIFICATION", key="kyc_redirect", use_container_width=True):
+                st.session_state.current_page = "KYC"
+                st.rerun()
+        return
+    
+    # Show KYC status for verified users
+    st.markdown("""
+    <div class="content-section" style="text-align: center; background: #e6ffe6; border-color: #00cc00;">
+        <h2 style="color: #008000; font-size: 2rem; font-weight: 900; margin: 0;">✅ KYC VERIFIED!</h2>
+        <p style="color: #008000; font-size: 1.2rem; margin: 0.5rem 0 0 0; font-weight: 600;">You can invest in properties</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div class="stat-item">
+            <div class="stat-value">✅ Verified</div>
+            <div class="stat-label">Status</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div class="stat-item">
+            <div class="stat-value">💰 $50,000</div>
+            <div class="stat-label">Investment Limit</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown("""
+        <div class="stat-item">
+            <div class="stat-value">🔒 Secure</div>
+            <div class="stat-label">Data Protection</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Re-verify button
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("🔄 RE-VERIFY KYC", use_container_width=True):
+            st.session_state.kyc_status['verified'] = False
+            st.rerun()
+    
+    # Every session reads the same catalogue snapshot
+    catalogue_version, catalogue = get_shared_catalogue().snapshot()
+    
+    # Debug information
+    st.info(f"Total properties available: {len(catalogue)}")
+    
+    # Search and filters
+    st.markdown("""
+    <div class="search-container">
+        <h2 class="search-title">🔍 SEARCH PROPERTIES</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 15s linear infinite;
+                white-space: nowrap;
+                font-size: 1.1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 2px;
+            ">
+                🏠 FIND YOUR PERFECT INVESTMENT • PREMIUM PROPERTIES IN PAKISTAN • HIGH ROI OPPORTUNITIES • BLOCKCHAIN SECURED • FRACTIONAL OWNERSHIP • LIQUID REAL ESTATE • INVEST FROM ANYWHERE • 🏠
+            </div>
+        </div>
+    </div>
+    
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        location_filter = st.selectbox("Location", ["All"] + catalogue.locations())
+    
+    with col2:
+        min_roi = st.slider("Min ROI (%)", 0, 30, 8)
+    
+    with col3:
+        max_price = st.slider("Max Price (PKR)", 5000000, 50000000, 50000000)
+    
+    with col4:
+        property_type = st.selectbox("Property Type", ["All", "Residential", "Commercial", "Mixed-Use"])
+    
+    # Filter properties (resolved through the catalogue's secondary indexes); the matching
+    # positions are kept per session and only recomputed for new filters or a new catalogue version
+    with profile_section('marketplace.filter'):
+        filter_key = (catalogue_version, location_filter, min_roi, max_price, property_type)
+        cached_filter = st.session_state.get('marketplace_filter')
+        if cached_filter is None or cached_filter['key'] != filter_key:
+            cached_filter = st.session_state.marketplace_filter = {
+                'key': filter_key,
+                'positions': catalogue.positions(
+                    location=None if location_filter == "All" else location_filter,
+                    min_roi=min_roi,
+                    max_price=max_price,
+                    property_type=None if property_type == "All" else property_type
+                )
+            }
+        filtered_properties = catalogue.frame.iloc[cached_filter['positions']]
+    
+    # Debug information
+    st.info(f"Filtered properties: {len(filtered_properties)}")
+    if len(filtered_properties) == 0:
+        st.warning("No properties match your filters. Try adjusting the search criteria.")
+        return
+    
+    # Display properties
+    st.markdown(f"""
+    <div class="content-section">
+        <h2 class="section-title">📋 AVAILABLE PROPERTIES ({len(filtered_properties)} FOUND)</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 12s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                💰 INVEST IN TOKENIZED REAL ESTATE • OWN FRACTIONS OF PREMIUM PROPERTIES • EARN PASSIVE INCOME • TRADE TOKENS 24/7 • BLOCKCHAIN TRANSPARENCY • SECURE INVESTMENT • HIGH RETURNS • 💰
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Sorting and pagination: only the current page is turned into cards
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        sort_label = st.selectbox("Sort by", list(MARKETPLACE_SORT_OPTIONS))
+    with col2:
+        page_size = st.selectbox("Per page", MARKETPLACE_PAGE_SIZES, index=MARKETPLACE_PAGE_SIZES.index(MARKETPLACE_DEFAULT_PAGE_SIZE))
+    
+    # Go back to the first page whenever the result set or its ordering changes
+    listing_query = (filter_key, sort_label, page_size)
+    if st.session_state.get('marketplace_query') != listing_query:
+        st.session_state.marketplace_query = listing_query
+        st.session_state.marketplace_page = 1
+    
+    total_pages = max(1, -(-len(filtered_properties) // page_size))
+    with col3:
+        prev_col, label_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            if st.button("◀", key="marketplace_prev", disabled=st.session_state.marketplace_page <= 1):
+                st.session_state.marketplace_page -= 1
+        with next_col:
+            if st.button("▶", key="marketplace_next", disabled=st.session_state.marketplace_page >= total_pages):
+                st.session_state.marketplace_page += 1
+        st.session_state.marketplace_page = min(max(1, st.session_state.marketplace_page), total_pages)
+        with label_col:
+            st.markdown(f"**Page {st.session_state.marketplace_page} of {total_pages}**")
+    
+    with profile_section('marketplace.page'):
+        sort_by, descending = MARKETPLACE_SORT_OPTIONS[sort_label]
+        page_properties = PropertyCatalogue.records(PropertyCatalogue.page(
+            filtered_properties,
+            sort_by=sort_by,
+            descending=descending,
+            page=st.session_state.marketplace_page,
+            page_size=page_size
+        ))
+    
+        # Live token inventory for the cards on this page
+        tokens_available = get_token_ledger().available(prop['id'] for prop in page_properties)
+    
+    # Property cards for the current page; card and button styles live in assets/marketplace.css
+    with profile_section('marketplace.cards'):
+        for i, prop in enumerate(page_properties):
+            # Property card; layout and animations come from the .listing-card classes
+            st.markdown(PROPERTY_CARD_TEMPLATE.format(index=i), unsafe_allow_html=True)
+        
+            col1, col2, col3 = st.columns([1, 2, 1])
+        
+            with col1:
+                st.image(get_image_cache().thumbnail(prop['image_url'], width=200), width=200)
+        
+            with col2:
+                st.markdown(f"### {prop['name']}")
+                st.markdown(f"**Location:** {prop['location']} | **Type:** {prop['property_type']}")
+                st.markdown(f"**Price:** PKR {prop['price']:,} | **Year Built:** {prop['year_built']}")
+                st.markdown(f"**Square Feet:** {prop['square_feet']:,} sq ft")
+                st.markdown(f"**Description:** {prop['description']}")
+                st.markdown(f"**Token Supply:** {prop['tokens_supply']:,}")
+                st.markdown(f"**Available:** {tokens_available.get(prop['id'], prop['tokens_available']):,.0f}")
+        
+            with col3:
+                st.markdown(f"""
+                <div style="
+                    background: #000; 
+                    color: #fff; 
+                    padding: 1rem; 
+                    border-radius: 8px; 
+                    text-align: center;
+                    margin-bottom: 1rem;
+                ">
+                    <h3 style="margin: 0; font-size: 1.5rem;">{prop['roi']}% ROI</h3>
+                </div>
+                """, unsafe_allow_html=True)
+            
+                # Investment forms are only built for the card the user expanded
+                if st.button("💰 INVEST", key=f"expand_{prop['id']}", use_container_width=True):
+                    st.session_state.expanded_property = prop['id']
+            
+                if st.session_state.get('expanded_property') == prop['id']:
+                    with st.form(key=f"invest_form_{prop['id']}"):
+                        st.markdown("**Investment Amount**")
+                        investment_amount = st.number_input(
+                            "Amount (PKR)", 
+                            min_value=100000, 
+                            max_value=prop['price'], 
+                            value=1000000,
+                            key=f"amount_{prop['id']}",
+                            label_visibility="collapsed"
+                        )
+                
+                        if st.form_submit_button("💰 INVEST NOW", use_container_width=True):
+                                # Calculate investment details
+                                token_price = prop['price'] / prop['tokens_supply']
+                                tokens_received = investment_amount / token_price
+                                ownership_percent = (tokens_received / prop['tokens_supply']) * 100
+                                platform_fee = investment_amount * 0.02  # 2% platform fee
+                                net_investment = investment_amount - platform_fee
+                        
+                                # Hold the tokens first so concurrent investors cannot oversubscribe the property
+                                ledger = get_token_ledger()
+                                try:
+                                    reservation_id = ledger.reserve(prop['id'], tokens_received)
+                                except InsufficientTokens:
+                                    reservation_id = None
+                                    remaining = ledger.available([prop['id']]).get(prop['id'], 0)
+                                    st.error(f"Only {remaining:,.0f} tokens of {prop['name']} are still available.")
+                        
+                                if reservation_id is not None:
+                                    # Store investment
+                                    investment = {
+                                        'property_id': prop['id'],
+                                        'property_name': prop['name'],
+                                        'investment_amount': investment_amount,
+                                        'tokens_received': tokens_received,
+                                        'ownership_percent': ownership_percent,
+                                        'roi': prop['roi'],
+                                        'platform_fee': platform_fee,
+                                        'net_investment': net_investment,
+                                        'timestamp': datetime.now()
+                                    }
+                        
+                                    try:
+                                        get_storage().record_investment(current_user_id(), investment)
+                                    except Exception:
+                                        ledger.release(reservation_id)
+                                        raise
+                                    ledger.commit(reservation_id)
+                                    st.session_state.investments.append(investment)
+                                    holding = st.session_state.user_portfolio.setdefault(prop['id'], {'tokens': 0.0, 'invested': 0.0})
+                                    holding['tokens'] += tokens_received
+                                    holding['invested'] += investment_amount
+                        
+                                    # Render the invoice in the background; the download section picks it up when ready
+                                    st.session_state.latest_pdf = {
+                                        'job': get_invoice_queue().submit(
+                                            prop['name'],
+                                            investment_amount,
+                                            tokens_received,
+                                            ownership_percent,
+                                            prop['roi']
+                                        ),
+                                        'filename': f"investment_invoice_{prop['id']}.pdf"
+                                    }
+                        
+                                    st.success(f"Investment successful! You received {tokens_received:,.0f} tokens ({ownership_percent:.2f}% ownership)")
+                                    st.rerun()
+        
+            # Close the property card div
+            st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Download button for latest investment (outside of form); filled in once the invoice is rendered
+    invoice_slot = st.container()
+    
+    # Seller registration
+    st.markdown("""
+    <div class="content-section">
+        <h2 class="section-title">🏗️ REGISTER NEW PROPERTY</h2>
+        <div style="
+            background: #000;
+            color: #fff;
+            padding: 1rem;
+            border-radius: 8px;
+            margin: 1rem 0;
+            overflow: hidden;
+            position: relative;
+        ">
+            <div style="
+                animation: runningText 18s linear infinite;
+                white-space: nowrap;
+                font-size: 1rem;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            ">
+                🏗️ LIST YOUR PROPERTY • TOKENIZE REAL ESTATE • EARN FROM RENTAL INCOME • INCREASE LIQUIDITY • REACH GLOBAL INVESTORS • BLOCKCHAIN SECURITY • FRACTIONAL OWNERSHIP • 🏗️
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="
+        background: #f8f9fa;
+        border: 2px solid #000;
+        border-radius: 10px;
+        padding: 1rem;
+        margin: 1rem 0;
+    ">
+    """, unsafe_allow_html=True)
+    
+    with st.expander("➕ ADD PROPERTY TO MARKETPLACE", expanded=False):
+        with st.form("seller_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                new_prop_name = st.text_input("Property Name")
+                new_prop_location = st.selectbox("Location", ["Karachi", "Lahore", "Islamabad", "Rawalpindi", "Faisalabad", "Multan", "Peshawar", "Quetta", "Gujranwala", "Sialkot"])
+                new_prop_price = st.number_input("Property Price (PKR)", min_value=1000000, max_value=100000000, value=10000000)
+                new_prop_roi = st.number_input("Expected ROI (%)", min_value=0.0, max_value=50.0, value=15.0)
+            
+            with col2:
+                new_prop_type = st.selectbox("Property Type", ["Residential", "Commercial", "Mixed-Use"])
+                new_prop_year = st.number_input("Year Built", min_value=1900, max_value=2024, value=2020)
+                new_prop_sqft = st.number_input("Square Feet", min_value=1000, max_value=100000, value=5000)
+                new_prop_tokens = st.number_input("Token Supply", min_value=100, max_value=50000, value=1000)
+            
+            new_prop_description = st.text_area("Property Description")
+            
+            if st.form_submit_button("🏠 Register Property"):
+                new_property = {
+                    'name': new_prop_name,
+                    'location': new_prop_location,
+                    'price': new_prop_price,
+                    'roi': new_prop_roi,
+                    'tokens_supply': new_prop_tokens,
+                    'tokens_available': new_prop_tokens,
+                    'image_url': f'https://picsum.photos/400/300?random={len(catalogue) + 100}',
+                    'description': new_prop_description,
+                    'property_type': new_prop_type,
+                    'year_built': new_prop_year,
+                    'square_feet': new_prop_sqft
+                }
+                
+                # Storage assigns the listing id; every session sees it from the next catalogue version
+                get_shared_catalogue().append(get_storage().add_property(new_property))
+                st.success("Property registered successfully!")
+                st.rerun()
+    
+    # Close the seller form container
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    render_invoice_download(invoice_slot)
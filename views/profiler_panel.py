@@ -0,0 +1,37 @@
+"""Debug sidebar panel: per-section rerun costs, deferred imports and a JSON export"""
+import streamlit as st
+import pandas as pd
+import tracemalloc
+from profiling import PROFILER, track_allocations
+from startup import import_report
+
+def profiler_panel():
+    """Profiler summary for the sections recorded so far in this process"""
+    with st.expander("🛠️ Profiler"):
+        track = st.checkbox(
+            "Track allocations",
+            value=tracemalloc.is_tracing(),
+            help="Record allocation deltas with tracemalloc; slows every section down while enabled"
+        )
+        track_allocations(track)
+        
+        summary = PROFILER.summary()
+        if summary:
+            st.dataframe(pd.DataFrame(summary).set_index('section'), use_container_width=True)
+        else:
+            st.caption("No sections recorded yet.")
+        
+        imports = import_report()
+        if imports:
+            st.markdown("**Deferred imports**")
+            st.dataframe(pd.DataFrame(imports).set_index('module'), use_container_width=True)
+        
+        st.download_button(
+            label="Export JSON",
+            data=PROFILER.export_json(),
+            file_name="proptoken_profile.json",
+            mime="application/json"
+        )
+        if st.button("Clear profile"):
+            PROFILER.clear()
+            st.rerun()